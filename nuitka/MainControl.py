@@ -106,6 +106,29 @@ def dumpTreeXML(tree):
     TreeXML.dump(xml_root)
 
 
+def dumpModuleGraphXML():
+    xml_root = TreeXML.Element("module_graph")
+
+    for module in ModuleRegistry.getDoneModules():
+        module_xml = TreeXML.Element(
+            "module",
+            name = module.getFullName(),
+            kind = module.kind
+        )
+
+        for used_module in ModuleRegistry.getUsedModules(module):
+            module_xml.append(
+                TreeXML.Element(
+                    "uses",
+                    name = used_module.getFullName()
+                )
+            )
+
+        xml_root.append(module_xml)
+
+    TreeXML.dump(xml_root)
+
+
 def displayTree(tree): # pragma: no cover
     # Import only locally so the Qt4 dependency doesn't normally come into play
     # when it's not strictly needed.
@@ -136,6 +159,22 @@ def getStandaloneDirectoryPath(main_module):
     )
 
 
+def getPgoDirectoryPath(main_module):
+    return Utils.abspath(
+        Utils.joinpath(
+            getSourceDirectoryPath(main_module),
+            "pgo"
+        )
+    )
+
+
+def getPgoTrainingDirectoryPath(main_module):
+    return Utils.joinpath(
+        getSourceDirectoryPath(main_module),
+        "pgo-training"
+    )
+
+
 def getResultBasepath(main_module):
     assert main_module.isCompiledPythonModule()
 
@@ -419,7 +458,7 @@ def makeSourceDirectory(main_module):
     )
 
 
-def runScons(main_module, quiet):
+def runScons(main_module, quiet, pgo_mode = None):
     # Scons gets transported many details, that we express as variables, and
     # have checks for them, leading to many branches, pylint: disable=R0912
 
@@ -465,10 +504,19 @@ def runScons(main_module, quiet):
     # away. On non-Windows you can should use ccache instead.
     if not Options.isRemoveBuildDir() and Utils.getOS() == "Windows":
         options["cache_mode"] = "true"
+    elif Options.isObjectCache() and Utils.getOS() != "Windows":
+        options["cache_dir"] = SconsInterface.getObjectCacheDir()
 
     if Options.isLto():
         options["lto_mode"] = "true"
 
+    if Options.getUnityBuildUnits() is not None:
+        options["unity_units"] = str(Options.getUnityBuildUnits())
+
+    if pgo_mode is not None:
+        options["pgo_mode"] = pgo_mode
+        options["pgo_dir"] = getPgoDirectoryPath(main_module)
+
     if Options.shallDisableConsoleWindow():
         options["win_disable_console"] = "true"
 
@@ -636,6 +684,9 @@ def compileTree(main_module):
     if Options.shallNotDoExecCppCall():
         return True, {}
 
+    if Options.isPgo():
+        return compileTreeWithPgo(main_module)
+
     # Run the Scons to build things.
     result, options = runScons(
         main_module = main_module,
@@ -645,8 +696,131 @@ def compileTree(main_module):
     return result, options
 
 
+def runPgoTraining(binary_filename):
+    if Options.getPgoExecutable() is not None:
+        args = [Options.getPgoExecutable()]
+    else:
+        args = [Utils.abspath(binary_filename)]
+
+    args += Options.getPgoArgs()
+
+    info("Running training for PGO: %s" % " ".join(args))
+
+    # We better flush these, the training run shares them.
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    try:
+        exit_code = subprocess.call(args)
+    except OSError as e:
+        sys.exit("Error, cannot run PGO training: %s" % e)
+
+    if exit_code != 0:
+        warning(
+            "PGO training run exited with %d, using its profile anyway." % (
+                exit_code
+            )
+        )
+
+
+def compileTreeWithPgo(main_module):
+    """ Build with profile guided optimization.
+
+        An instrumented build is made first, then the training run writes
+        the profile data, and with that the final build is made. The
+        profile data is removed afterwards.
+    """
+
+    pgo_dir = getPgoDirectoryPath(main_module)
+
+    if Utils.isDir(pgo_dir):
+        shutil.rmtree(pgo_dir)
+
+    result, options = runScons(
+        main_module = main_module,
+        quiet       = not Options.isShowScons(),
+        pgo_mode    = "generate"
+    )
+
+    if not result:
+        return result, options
+
+    # The training run of a standalone binary needs the DLLs and data files,
+    # these are added to a copy of the dist folder, as the final binary will
+    # be built into it.
+    if Options.isStandaloneMode():
+        training_dir = getPgoTrainingDirectoryPath(main_module)
+
+        if Utils.isDir(training_dir):
+            shutil.rmtree(training_dir)
+
+        shutil.copytree(getStandaloneDirectoryPath(main_module), training_dir)
+
+        training_binary = Utils.joinpath(
+            training_dir,
+            Utils.basename(getResultFullpath(main_module))
+        )
+
+        completeStandaloneDistribution(
+            dist_dir        = training_dir,
+            binary_filename = training_binary
+        )
+    else:
+        training_dir = None
+        training_binary = getResultFullpath(main_module)
+
+    runPgoTraining(training_binary)
+
+    if training_dir is not None:
+        shutil.rmtree(training_dir)
+
+    if not Utils.isDir(pgo_dir):
+        warning("PGO training run produced no profile data.")
+
+    result, options = runScons(
+        main_module = main_module,
+        quiet       = not Options.isShowScons(),
+        pgo_mode    = "use"
+    )
+
+    if Utils.isDir(pgo_dir):
+        shutil.rmtree(pgo_dir)
+
+    return result, options
+
+
 data_files = []
 
+def completeStandaloneDistribution(dist_dir, binary_filename):
+    """ Copy the used DLLs and the data files to the dist folder.
+
+        This is done after the binary was built, and with PGO also for the
+        instrumented binary, so its training run finds everything.
+    """
+
+    entry_points = [(binary_filename, None)]
+    entry_points += standalone_entry_points
+
+    for module in ModuleRegistry.getDoneUserModules():
+        entry_points.extend(
+            Plugins.considerExtraDlls(dist_dir, module)
+        )
+
+    copyUsedDLLs(
+        dist_dir                = dist_dir,
+        standalone_entry_points = entry_points
+    )
+
+    for source_filename, target_filename in data_files:
+        shutil.copy2(
+            source_filename,
+            Utils.joinpath(
+                dist_dir,
+                target_filename
+            )
+        )
+
+
 def main():
     """ Main program flow of Nuitka
 
@@ -703,6 +877,8 @@ def main():
     if Options.shallDumpBuiltTreeXML():
         for module in ModuleRegistry.getDoneModules():
             dumpTreeXML(module)
+    elif Options.shallDumpModuleGraphXML():
+        dumpModuleGraphXML()
     elif Options.shallDisplayBuiltTree():
         displayTree(main_module)
     else:
@@ -724,37 +900,14 @@ def main():
             )
 
         if Options.isStandaloneMode():
-            binary_filename = options["result_name"] + ".exe"
-
-            standalone_entry_points.insert(
-                0,
-                (binary_filename, None)
-            )
-
-            dist_dir = getStandaloneDirectoryPath(main_module)
-
-            for module in ModuleRegistry.getDoneUserModules():
-                standalone_entry_points.extend(
-                    Plugins.considerExtraDlls(dist_dir, module)
-                )
-
             if Utils.getOS() == "NetBSD":
                 warning("Standalone mode on NetBSD is not functional, due to $ORIGIN linkage not being supported.")
 
-            copyUsedDLLs(
-                dist_dir                = dist_dir,
-                standalone_entry_points = standalone_entry_points
+            completeStandaloneDistribution(
+                dist_dir        = getStandaloneDirectoryPath(main_module),
+                binary_filename = options["result_name"] + ".exe"
             )
 
-            for source_filename, target_filename in data_files:
-                shutil.copy2(
-                    source_filename,
-                    Utils.joinpath(
-                        getStandaloneDirectoryPath(main_module),
-                        target_filename
-                    )
-                )
-
         # Modules should not be executable, but Scons creates them like it, fix
         # it up here.
         if Utils.getOS() != "Windows" and Options.shallMakeModule():
@@ -22,7 +22,9 @@
     and move done modules out of it.
 
     That process can be restarted and modules will be fetched back from
-    the existing set of modules.
+    the existing set of modules. It can also be restarted only for changed
+    modules and the ones using them, for that the graph of module uses is
+    maintained.
 """
 
 from nuitka.containers.oset import OrderedSet
@@ -38,9 +40,26 @@ active_modules = OrderedSet()
 # Already traversed modules
 done_modules = set()
 
+# Already traversed modules, sorted by name, cached for "getDoneModules".
+done_modules_sorted = None
+
 # Uncompiled modules
 uncompiled_modules = set()
 
+# Modules whose state was reset for the current traversal already.
+started_modules = set()
+
+# The module currently being traversed, uses of functions are attributed to it.
+current_module = None
+
+# Modules used by a module, i.e. imported ones, or ones providing functions
+# to it. The key is the using module, the value the set of used modules.
+module_uses = {}
+
+# The reverse of "module_uses", the key is the used module, the value the set
+# of modules using it.
+module_users = {}
+
 
 def addRootModule(module):
     root_modules.add(module)
@@ -106,30 +125,166 @@ def removeUncompiledModule(module):
 def startTraversal():
     # Using global here, as this is really a singleton, in the form of a module,
     # pylint: disable=W0603
-    global active_modules, done_modules
+    global active_modules, done_modules, done_modules_sorted
 
     active_modules = OrderedSet(root_modules)
     done_modules = set()
+    done_modules_sorted = None
+
+    # The uses will be discovered again during the traversal.
+    module_uses.clear()
+    module_users.clear()
+
+    started_modules.clear()
 
     for active_module in active_modules:
-        active_module.startTraversal()
+        _startModuleTraversal(active_module)
+
+
+def startIncrementalTraversal(changed_modules):
+    """ Restart the traversal only for changed modules, users and dependencies.
+
+        All modules depending on a changed module, directly or indirectly,
+        are traversed again. The modules used by these are traversed again
+        too, as they may have lost uses of their functions, or assignments to
+        their variables. The other modules keep their state from the previous
+        traversal, they cannot see a difference.
+    """
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global active_modules, done_modules_sorted
+
+    requeue_modules = OrderedSet()
+    pending_modules = list(changed_modules)
+
+    while pending_modules:
+        module = pending_modules.pop()
+
+        if module is None or module in requeue_modules:
+            continue
+
+        requeue_modules.add(module)
+        pending_modules.extend(module_users.get(module, ()))
+
+    for module in tuple(requeue_modules):
+        for used_module in getUsedModules(module):
+            if used_module in done_modules:
+                requeue_modules.add(used_module)
+
+    # Requeued modules are discovered again by their users, if they are still
+    # used. Those used by modules not traversed again, or without a user, need
+    # to be given.
+    active_modules = OrderedSet(
+        module
+        for module in
+        requeue_modules
+        if module in root_modules or \
+           not module_users.get(module, OrderedSet()) <= requeue_modules
+    )
+
+    # The uses of functions made by requeued modules are discovered again,
+    # the ones made by other modules remain, so no module state is reset.
+    for module in done_modules:
+        module.removeFunctionUsers(requeue_modules)
+
+    started_modules.clear()
+    started_modules.update(done_modules)
+
+    # These record their uses again, when traversed.
+    for module in requeue_modules:
+        done_modules.discard(module)
+        _removeModuleUses(module)
+
+    done_modules_sorted = None
+
+
+def finishTraversal():
+    """ Remove done modules that are no longer used.
+
+        After an incremental traversal, modules that were only used by
+        requeued modules may have lost all their users.
+    """
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global done_modules_sorted
+
+    reachable_modules = set()
+    pending_modules = list(root_modules)
+    pending_modules.extend(module_uses.get(None, ()))
+
+    while pending_modules:
+        module = pending_modules.pop()
+
+        if module in reachable_modules:
+            continue
+
+        reachable_modules.add(module)
+        pending_modules.extend(getUsedModules(module))
+
+    dropped_modules = done_modules - reachable_modules
+
+    for module in dropped_modules:
+        done_modules.remove(module)
+        _removeModuleUses(module)
+
+        done_modules_sorted = None
+
+    # The functions used by dropped modules only are unused now.
+    if dropped_modules:
+        for module in done_modules:
+            module.removeFunctionUsers(dropped_modules)
 
 
-def addUsedModule(module):
+def addUsedModule(module, using_module = None):
+    # Uses without a using module are recorded with "None" as the user, these
+    # are then considered always used.
+    if using_module is not module:
+        if using_module not in module_uses:
+            module_uses[using_module] = OrderedSet()
+
+        module_uses[using_module].add(module)
+
+        if module not in module_users:
+            module_users[module] = OrderedSet()
+
+        module_users[module].add(using_module)
+
     if module not in done_modules and module not in active_modules:
         active_modules.add(module)
 
+        _startModuleTraversal(module)
+
+
+def _startModuleTraversal(module):
+    if module not in started_modules:
+        started_modules.add(module)
+
         module.startTraversal()
 
 
+def _removeModuleUses(module):
+    for used_module in module_uses.pop(module, ()):
+        module_users[used_module].discard(module)
+
+
 def nextModule():
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global done_modules_sorted, current_module
+
     if active_modules:
-        result = active_modules.pop()
-        done_modules.add(result)
+        current_module = active_modules.pop()
+        done_modules.add(current_module)
 
-        return result
+        done_modules_sorted = None
     else:
-        return None
+        current_module = None
+
+    return current_module
+
+
+def getCurrentModule():
+    return current_module
 
 
 def remainingCount():
@@ -137,24 +292,39 @@ def remainingCount():
 
 
 def getDoneModules():
-    return sorted(
-        done_modules,
-        key = lambda module : module.getFullName()
-    )
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global done_modules_sorted
+
+    # Sorting is done only once for a stable set of done modules, as this is
+    # called a lot.
+    if done_modules_sorted is None:
+        done_modules_sorted = sorted(
+            done_modules,
+            key = lambda module : module.getFullName()
+        )
+
+    return done_modules_sorted
 
 
 def getDoneUserModules():
-    return sorted(
-        [
-            module
-            for module in
-            done_modules
-            if not module.isInternalModule()
-            if not module.isMainModule()
-        ],
-        key = lambda module : module.getFullName()
-    )
+    return [
+        module
+        for module in
+        getDoneModules()
+        if not module.isInternalModule()
+        if not module.isMainModule()
+    ]
 
 
 def removeDoneModule(module):
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=W0603
+    global done_modules_sorted
+
     done_modules.remove(module)
+    done_modules_sorted = None
+
+
+def getUsedModules(module):
+    return module_uses.get(module, ())
@@ -22,6 +22,7 @@ Nuitka V0.5.17pre3
 Copyright (C) 2015 Kay Hayen."""
 
 import logging
+import shlex
 import sys
 from optparse import SUPPRESS_HELP, OptionGroup, OptionParser
 
@@ -280,6 +281,16 @@ dump_group.add_option(
     help    = "Dump the final result of optimization as XML, then exit."
 )
 
+dump_group.add_option(
+    "--dump-module-graph",
+    action  = "store_true",
+    dest    = "dump_module_graph",
+    default = False,
+    help    = """\
+Dump the graph of module uses after optimization as XML, then exit. Each
+module lists the modules it imports or otherwise uses."""
+)
+
 dump_group.add_option(
     "--display-tree",
     action  = "store_true",
@@ -414,7 +425,8 @@ debug_group.add_option(
     dest    = "profile",
     default = False,
     help    = """\
-Enable vmprof based profiling of time spent. Defaults to off."""
+Enable sampling based profiling of time spent in compiled code, written as
+collapsed stacks to "nuitka-profile.txt" on exit. Defaults to off."""
 )
 
 debug_group.add_option(
@@ -459,6 +471,17 @@ is for debugging and code coverage analysis that doesn't waste CPU. Defaults to
 off."""
 )
 
+debug_group.add_option(
+    "--no-incremental-optimization",
+    action  = "store_false",
+    dest    = "incremental_optimization",
+    default = True,
+    help    = """\
+Traverse all modules in every optimization pass, not only the changed ones and
+the modules related to them. The result must be the same, this is for checking
+that. Defaults to off."""
+)
+
 debug_group.add_option(
     "--experimental",
     action  = "store_true",
@@ -549,6 +572,74 @@ Use link time optimizations if available and usable (g++ 4.6 and higher).
 Defaults to off."""
 )
 
+cpp_compiler_group.add_option(
+    "--unity-build",
+    action  = "store",
+    type    = "int",
+    dest    = "unity_build",
+    metavar = 'N',
+    default = None,
+    help    = """\
+Batch the generated code of the modules into N translation units of about
+equal size, which reduces compiler overhead and allows more inlining between
+modules. Defaults to off."""
+)
+
+cpp_compiler_group.add_option(
+    "--object-cache",
+    action  = "store_true",
+    dest    = "object_cache",
+    default = False,
+    help    = """\
+Cache compiled objects between builds, keyed by their content and compiler
+options. The cache lives in "NUITKA_CACHE_DIR" if set, or else in the user
+cache directory. Not available on Windows. Defaults to off."""
+)
+
+cpp_compiler_group.add_option(
+    "--object-cache-size",
+    action  = "store",
+    type    = "int",
+    dest    = "object_cache_size",
+    metavar = "MB",
+    default = 1024,
+    help    = """\
+Size limit of the object cache in MB, least recently used objects are removed
+when exceeding it. Defaults to 1024."""
+)
+
+cpp_compiler_group.add_option(
+    "--pgo",
+    action  = "store_true",
+    dest    = "pgo",
+    default = False,
+    help    = """\
+Use profile guided optimization (g++ only). Builds an instrumented binary
+first, runs it for training, and then rebuilds using the collected profile.
+Defaults to off."""
+)
+
+cpp_compiler_group.add_option(
+    "--pgo-args",
+    action  = "store",
+    dest    = "pgo_args",
+    default = "",
+    help    = """\
+Arguments to pass to the program in the training run of "--pgo", split like
+a shell would do it. Default empty."""
+)
+
+cpp_compiler_group.add_option(
+    "--pgo-executable",
+    action  = "store",
+    dest    = "pgo_executable",
+    default = None,
+    help    = """\
+Command to run for the training run of "--pgo" instead of the compiled
+program, e.g. a script exercising it. Required for modules. Default is
+the compiled program itself."""
+)
+
 parser.add_option_group(cpp_compiler_group)
 
 tracing_group = OptionGroup(
@@ -707,6 +798,22 @@ if options.verbose:
 else:
     logging.getLogger().setLevel(logging.INFO)
 
+if options.pgo and not options.executable and options.pgo_executable is None:
+    sys.exit("""
+Error, modules cannot be run for "--pgo" training, need "--pgo-executable".""")
+
+if options.unity_build is not None and options.unity_build < 1:
+    sys.exit("""
+Error, "--unity-build" needs at least 1 translation unit, not %d.""" % (
+        options.unity_build
+    ))
+
+if options.object_cache_size < 1:
+    sys.exit("""
+Error, "--object-cache-size" needs to be positive, not %d.""" % (
+        options.object_cache_size
+    ))
+
 # Standalone mode implies an executable, not importing "site" module, which is
 # only for this machine, recursing to all modules, and even including the
 # standard library.
@@ -726,6 +833,9 @@ def shallRunInDebugger():
 def shallDumpBuiltTreeXML():
     return options.dump_xml
 
+def shallDumpModuleGraphXML():
+    return options.dump_module_graph
+
 def shallDisplayBuiltTree():
     return options.display_tree
 
@@ -859,6 +969,26 @@ def getJobLimit():
 def isLto():
     return options.lto
 
+def getUnityBuildUnits():
+    """ Number of unity translation units, None if not active. """
+
+    return options.unity_build
+
+def isObjectCache():
+    return options.object_cache
+
+def getObjectCacheSize():
+    return options.object_cache_size * 1024 * 1024
+
+def isPgo():
+    return options.pgo
+
+def getPgoArgs():
+    return shlex.split(options.pgo_args)
+
+def getPgoExecutable():
+    return options.pgo_executable
+
 def isClang():
     return options.clang
 
@@ -889,6 +1019,9 @@ def isRemoveBuildDir():
 def getIntendedPythonVersion():
     return options.python_version
 
+def isIncrementalOptimization():
+    return options.incremental_optimization
+
 def isExperimental():
     return hasattr(options, "experimental") and options.experimental
 
@@ -19,11 +19,21 @@
 
 All the information to lookup line and file of a code location, together with
 the future flags in use there.
+
+These objects are interned, i.e. there is only ever one object for a given
+combination of filename, line, future spec, and internal flag. That keeps the
+memory usage for the many nodes sharing the same values low, and allows to
+compare them by identity only.
 """
 
 from nuitka.nodes.FutureSpecs import FutureSpec
 from nuitka.utils.InstanceCounters import counted_del, counted_init
 
+# Interned source references, by (filename, line, future_spec, internal)
+# tuple. The future spec is mutable and compared by identity, which is what
+# we want, each module has its own.
+source_refs = {}
+
 
 class SourceCodeReference(object):
     # TODO: Measure the access speed impact of slots. The memory savings is
@@ -32,67 +42,45 @@ class SourceCodeReference(object):
 
     @classmethod
     def fromFilenameAndLine(cls, filename, line, future_spec):
-        result = cls()
-
-        result.filename = filename
-        result.line = line
-        result.future_spec = future_spec
-
-        return result
+        return _getInternedSourceReference(
+            filename    = filename,
+            line        = line,
+            future_spec = future_spec,
+            internal    = False
+        )
 
     __del__ = counted_del()
 
     @counted_init
-    def __init__(self):
-        self.line = None
-        self.filename = None
-        self.future_spec = None
-        self.internal = False
+    def __init__(self, filename, line, future_spec, internal):
+        self.filename = filename
+        self.line = line
+        self.future_spec = future_spec
+        self.internal = internal
 
     def __repr__(self):
         return "<%s to %s:%s>" % (self.__class__.__name__, self.filename, self.line)
 
-    def __cmp__(self, other):
-        if other is None:
-            return -1
-
-        assert isinstance(other, SourceCodeReference), other
-
-        result = cmp(self.filename, other.filename)
-
-        if result == 0:
-            result = cmp(self.line, other.line)
-
-        if result == 0:
-            result = cmp(self.internal, other.internal)
-
-        return result
-
-    def _clone(self, line):
-        """ Make a copy it itself.
+    def _clone(self, line, internal):
+        """ Get the reference with changed line and internal flag.
 
+            This doesn't make a copy, but looks up the interned object.
         """
-        result = SourceCodeReference.fromFilenameAndLine(
+        return _getInternedSourceReference(
             filename    = self.filename,
             line        = line,
-            future_spec = self.future_spec
+            future_spec = self.future_spec,
+            internal    = internal
         )
 
-        result.internal = self.internal
-
-        return result
-
     def atInternal(self):
-        """ Make a copy it itself but mark as internal code.
+        """ Get the same reference, but marked as internal code.
 
-            Avoids useless copies, by returning an internal object again if
+            Avoids useless lookups, by returning an internal object again if
             it is already internal.
         """
         if not self.internal:
-            result = self._clone(self.line)
-            result.internal = True
-
-            return result
+            return self._clone(self.line, True)
         else:
             return self
 
@@ -100,14 +88,14 @@ class SourceCodeReference(object):
     def atLineNumber(self, line):
         """ Make a reference to the same file, but different line.
 
-            Avoids useless copies, by returning same object if the line is
+            Avoids useless lookups, by returning same object if the line is
             the same.
         """
 
         assert type(line) is int, line
 
         if self.line != line:
-            return self._clone(line)
+            return self._clone(line, self.internal)
         else:
             return self
 
@@ -127,6 +115,24 @@ class SourceCodeReference(object):
         return self.internal
 
 
+def _getInternedSourceReference(filename, line, future_spec, internal):
+    key = filename, line, future_spec, internal
+
+    try:
+        return source_refs[key]
+    except KeyError:
+        result = SourceCodeReference(
+            filename    = filename,
+            line        = line,
+            future_spec = future_spec,
+            internal    = internal
+        )
+
+        source_refs[key] = result
+
+        return result
+
+
 def fromFilename(filename):
     return SourceCodeReference.fromFilenameAndLine(
         filename    = filename,
@@ -118,6 +118,14 @@ class GlobalVariableTrace:
 
         return None
 
+    def getAssignTraces(self):
+        return [
+            trace
+            for trace in
+            self.traces
+            if trace.isAssignTrace()
+        ]
+
     def hasWritesOutsideOf(self, provider):
         for trace in self.traces:
             if trace.isAssignTrace():
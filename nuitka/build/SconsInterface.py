@@ -153,6 +153,97 @@ def setupSconsEnvironment():
             os.environ["PYTHONHOME"] = old_pythonhome
 
 
+def getObjectCacheDir():
+    """ Where the object cache lives, shared by all builds of the user. """
+
+    if "NUITKA_CACHE_DIR" in os.environ:
+        cache_dir = os.environ["NUITKA_CACHE_DIR"]
+    else:
+        cache_dir = Utils.joinpath(
+            os.environ.get(
+                "XDG_CACHE_HOME",
+                Utils.joinpath(os.path.expanduser('~'), ".cache")
+            ),
+            "Nuitka"
+        )
+
+    return Utils.joinpath(cache_dir, "objects")
+
+
+def _getCacheDebugFilename(options):
+    return Utils.joinpath(options["source_dir"], "scons-cache.log")
+
+
+def _processCacheDebugFile(cache_dir, cache_debug_filename):
+    """ Count hits and misses of the object cache and mark hits as used. """
+
+    hits = misses = 0
+
+    with open(cache_debug_filename) as cache_debug_file:
+        for line in cache_debug_file:
+            if not line.startswith("CacheRetrieve("):
+                continue
+
+            if " retrieving from " in line:
+                hits += 1
+
+                # Scons stores by signature, below the capitalized first
+                # letter of it.
+                signature = line.split(" retrieving from ", 1)[1].strip()
+
+                cache_filename = Utils.joinpath(
+                    cache_dir,
+                    signature[0].upper(),
+                    signature
+                )
+
+                # Least recently used is decided by modification time, as
+                # access times are often not maintained.
+                try:
+                    os.utime(cache_filename, None)
+                except OSError:
+                    pass
+            elif line.rstrip().endswith(" not in cache"):
+                misses += 1
+
+    return hits, misses
+
+
+def trimObjectCache(cache_dir, size_limit):
+    """ Remove least recently used objects until the size limit is kept. """
+
+    cache_files = []
+    total_size = 0
+
+    for dirpath, _dirnames, filenames in os.walk(cache_dir):
+        for filename in filenames:
+            cache_filename = Utils.joinpath(dirpath, filename)
+
+            try:
+                stat = os.stat(cache_filename)
+            except OSError:
+                continue
+
+            cache_files.append((stat.st_mtime, stat.st_size, cache_filename))
+            total_size += stat.st_size
+
+    removed = 0
+
+    for _mtime, size, cache_filename in sorted(cache_files):
+        if total_size <= size_limit:
+            break
+
+        try:
+            os.unlink(cache_filename)
+        except OSError:
+            continue
+
+        total_size -= size
+        removed += 1
+
+    return removed, total_size
+
+
 def buildSconsCommand(quiet, options):
     scons_command = getSconsBinaryCall()
 
@@ -178,6 +269,11 @@ def buildSconsCommand(quiet, options):
     if Options.isShowScons():
         scons_command.append("--debug=explain")
 
+    if "cache_dir" in options:
+        scons_command.append(
+            "--cache-debug=" + _getCacheDebugFilename(options)
+        )
+
     # Option values to provide to scons. Find these in the caller.
     for key, value in options.items():
         scons_command += [key + '=' + value]
@@ -192,4 +288,37 @@ def runScons(options, quiet):
         if Options.isShowScons():
             Tracing.printLine("Scons command:", ' '.join(scons_command))
 
-        return subprocess.call(scons_command, shell = False) == 0
+        result = subprocess.call(scons_command, shell = False) == 0
+
+    if "cache_dir" in options:
+        reportObjectCache(options)
+
+    return result
+
+
+def reportObjectCache(options):
+    cache_debug_filename = _getCacheDebugFilename(options)
+
+    if Utils.isFile(cache_debug_filename):
+        hits, misses = _processCacheDebugFile(
+            cache_dir            = options["cache_dir"],
+            cache_debug_filename = cache_debug_filename
+        )
+        os.unlink(cache_debug_filename)
+    else:
+        hits = misses = 0
+
+    removed, cache_size = trimObjectCache(
+        cache_dir  = options["cache_dir"],
+        size_limit = Options.getObjectCacheSize()
+    )
+
+    if Options.isShowScons() or Options.isShowProgress():
+        Tracing.printLine(
+            "Object cache: %d hits, %d misses, %d removed, %.1f MB used." % (
+                hits,
+                misses,
+                removed,
+                cache_size / (1024.0 * 1024.0)
+            )
+        )
@@ -77,6 +77,21 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION( PyObject *function_object,
 // Function call variant with no arguments provided at all.
 extern PyObject *CALL_FUNCTION_NO_ARGS( PyObject *called );
 
+// Method call variant with no arguments provided at all. The "method_self"
+// is given by "LOOKUP_METHOD", and if not NULL, the object to pass as the
+// first argument.
+NUITKA_MAY_BE_UNUSED static PyObject *CALL_METHOD_NO_ARGS( PyObject *called, PyObject *method_self )
+{
+    if ( method_self == NULL )
+    {
+        return CALL_FUNCTION_NO_ARGS( called );
+    }
+    else
+    {
+        return CALL_FUNCTION_WITH_ARGS1( called, method_self );
+    }
+}
+
 // Function call variants with positional arguments tuple.
 NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_POSARGS( PyObject *function_object, PyObject *positional_args )
 {
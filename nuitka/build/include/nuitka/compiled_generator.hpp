@@ -77,6 +77,12 @@ typedef struct {
     // Was it ever used, is it still running, or already finished.
     Generator_Status m_status;
 
+#if PYTHON_VERSION >= 330
+    // The compiled generator a "yield from" is currently delegating to, which
+    // can then be resumed directly, without switching to our context.
+    PyObject *m_delegate;
+#endif
+
 } Nuitka_GeneratorObject;
 
 extern PyTypeObject Nuitka_Generator_Type;
@@ -171,6 +171,192 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE( PyObject *source, PyObje
     }
 }
 
+// Inline cache for attribute lookups, one per attribute lookup in the
+// generated code. It remembers what "_PyType_Lookup" gave for a few types,
+// keyed by the type version tag, which CPython invalidates whenever the
+// type or one of its bases is modified.
+#define NUITKA_ATTRIBUTE_CACHE_SIZE 2
+
+struct Nuitka_AttributeCacheEntry
+{
+    PyTypeObject *type;
+    unsigned int version_tag;
+
+    // Borrowed, the type keeps it alive as long as the version tag is valid.
+    PyObject *descr;
+};
+
+struct Nuitka_AttributeCache
+{
+    struct Nuitka_AttributeCacheEntry entries[ NUITKA_ATTRIBUTE_CACHE_SIZE ];
+};
+
+// The generic attribute lookup of CPython, but with the type lookup result
+// already given.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE_WITH_DESCR( PyObject *source, PyTypeObject *type, PyObject *attr_name, PyObject *descr )
+{
+    descrgetfunc func = NULL;
+
+    if ( descr != NULL )
+    {
+        Py_INCREF( descr );
+
+#if PYTHON_VERSION < 300
+        if ( PyType_HasFeature( Py_TYPE( descr ), Py_TPFLAGS_HAVE_CLASS ) )
+#endif
+        {
+            func = Py_TYPE( descr )->tp_descr_get;
+
+            if ( func != NULL && PyDescr_IsData( descr ) )
+            {
+                PyObject *result = func( descr, source, (PyObject *)type );
+                Py_DECREF( descr );
+
+                return result;
+            }
+        }
+    }
+
+    PyObject **dict_pointer = _PyObject_GetDictPtr( source );
+
+    if ( dict_pointer != NULL && *dict_pointer != NULL )
+    {
+        PyObject *dict = *dict_pointer;
+        Py_INCREF( dict );
+
+        PyObject *result = PyDict_GetItem( dict, attr_name );
+
+        if ( result != NULL )
+        {
+            Py_INCREF( result );
+            Py_XDECREF( descr );
+            Py_DECREF( dict );
+
+            return result;
+        }
+
+        Py_DECREF( dict );
+    }
+
+    if ( func != NULL )
+    {
+        PyObject *result = func( descr, source, (PyObject *)type );
+        Py_DECREF( descr );
+
+        return result;
+    }
+
+    if ( descr != NULL )
+    {
+        return descr;
+    }
+
+    // Not found, let CPython produce the exact error.
+    return PyObject_GenericGetAttr( source, attr_name );
+}
+
+// Lookup in the type through the cache, the type must be ready. Returns a
+// borrowed reference or NULL, without setting an exception.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_TYPE_CACHED( PyTypeObject *type, PyObject *attr_name, struct Nuitka_AttributeCache *cache )
+{
+    assert( type->tp_dict != NULL );
+
+    if ( PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG ) )
+    {
+        for ( int i = 0; i < NUITKA_ATTRIBUTE_CACHE_SIZE; i++ )
+        {
+            struct Nuitka_AttributeCacheEntry *entry = &cache->entries[ i ];
+
+            if ( entry->type == type && entry->version_tag == type->tp_version_tag )
+            {
+                return entry->descr;
+            }
+        }
+    }
+
+    // This assigns a version tag to the type if it can have one.
+    PyObject *descr = _PyType_Lookup( type, attr_name );
+
+    if ( PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG ) )
+    {
+        // Newest entry first, the oldest one is dropped.
+        for ( int i = NUITKA_ATTRIBUTE_CACHE_SIZE - 1; i > 0; i-- )
+        {
+            cache->entries[ i ] = cache->entries[ i - 1 ];
+        }
+
+        cache->entries[ 0 ].type = type;
+        cache->entries[ 0 ].version_tag = type->tp_version_tag;
+        cache->entries[ 0 ].descr = descr;
+    }
+
+    return descr;
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE_CACHED( PyObject *source, PyObject *attr_name, struct Nuitka_AttributeCache *cache )
+{
+    CHECK_OBJECT( source );
+    CHECK_OBJECT( attr_name );
+
+    PyTypeObject *type = Py_TYPE( source );
+
+    // Only the generic lookup can be cached, everything else, e.g. classes
+    // with "__getattr__" or old style instances, takes the normal route.
+    if ( type->tp_getattro != PyObject_GenericGetAttr )
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+
+    if (unlikely( type->tp_dict == NULL ))
+    {
+        return PyObject_GenericGetAttr( source, attr_name );
+    }
+
+    PyObject *descr = LOOKUP_TYPE_CACHED( type, attr_name, cache );
+
+    return LOOKUP_ATTRIBUTE_WITH_DESCR( source, type, attr_name, descr );
+}
+
+// Lookup of an attribute that is going to be called. For functions found in
+// the type, no bound method is created, instead the function is returned and
+// "method_self" is set to the source, to be passed as first argument, see
+// "CALL_METHOD_NO_ARGS" and "CALL_METHOD_WITH_ARGS*".
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_METHOD( PyObject *source, PyObject *attr_name, PyObject **method_self, struct Nuitka_AttributeCache *cache )
+{
+    CHECK_OBJECT( source );
+    CHECK_OBJECT( attr_name );
+
+    *method_self = NULL;
+
+    PyTypeObject *type = Py_TYPE( source );
+
+    if ( type->tp_getattro != PyObject_GenericGetAttr || type->tp_dict == NULL )
+    {
+        return LOOKUP_ATTRIBUTE_CACHED( source, attr_name, cache );
+    }
+
+    PyObject *descr = LOOKUP_TYPE_CACHED( type, attr_name, cache );
+
+    if ( descr != NULL && ( Nuitka_Function_Check( descr ) || PyFunction_Check( descr ) ) )
+    {
+        // Functions are no data descriptors, so the instance dictionary
+        // takes precedence.
+        PyObject **dict_pointer = _PyObject_GetDictPtr( source );
+
+        Py_INCREF( descr );
+
+        if ( dict_pointer == NULL || *dict_pointer == NULL || PyDict_GetItem( *dict_pointer, attr_name ) == NULL )
+        {
+            *method_self = source;
+            return descr;
+        }
+
+        Py_DECREF( descr );
+    }
+
+    return LOOKUP_ATTRIBUTE_WITH_DESCR( source, type, attr_name, descr );
+}
+
 NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE_DICT_SLOT( PyObject *source )
 {
     CHECK_OBJECT( source );
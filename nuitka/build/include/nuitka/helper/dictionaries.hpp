@@ -177,6 +177,67 @@ NUITKA_MAY_BE_UNUSED static inline bool DICT_SET_ITEM( PyDictObject *dict, PyObj
     return DICT_SET_ITEM( (PyObject *)dict, key, value );
 }
 
+#if PYTHON_VERSION < 300
+// The probing sequence of "dictobject.c", which must be used for inserts.
+#define NUITKA_DICT_PERTURB_SHIFT 5
+
+// Insert a constant string key into a dictionary, that is currently being
+// created, and is known to have only string keys, none of them equal to this
+// one. This saves the lookup for existing keys, the result is laid out the
+// same as with "PyDict_SetItem", which is used when it would resize.
+NUITKA_MAY_BE_UNUSED static void DICT_SET_ITEM_NEW_STRING( PyObject *dict, PyObject *key, PyObject *value )
+{
+    CHECK_OBJECT( dict );
+    CHECK_OBJECT( key );
+    CHECK_OBJECT( value );
+
+    assert( PyDict_CheckExact( dict ) );
+    assert( PyString_CheckExact( key ) );
+
+    PyDictObject *mp = (PyDictObject *)dict;
+
+    if ( ( mp->ma_fill + 1 ) * 3 >= ( mp->ma_mask + 1 ) * 2 )
+    {
+        PyDict_SetItem( dict, key, value );
+        return;
+    }
+
+    long hash = ((PyStringObject *)key)->ob_shash;
+
+    if ( hash == -1 )
+    {
+        hash = PyString_Type.tp_hash( key );
+    }
+
+    size_t mask = (size_t)mp->ma_mask;
+    size_t i = (size_t)hash & mask;
+    PyDictEntry *entry = &mp->ma_table[ i ];
+
+    for ( size_t perturb = hash; entry->me_key != NULL; perturb >>= NUITKA_DICT_PERTURB_SHIFT )
+    {
+        assert( entry->me_key != key );
+
+        i = ( i << 2 ) + i + perturb + 1;
+        entry = &mp->ma_table[ i & mask ];
+    }
+
+    if ( !_PyObject_GC_IS_TRACKED( mp ) && _PyObject_GC_MAY_BE_TRACKED( value ) )
+    {
+        _PyObject_GC_TRACK( mp );
+    }
+
+    Py_INCREF( key );
+    Py_INCREF( value );
+
+    entry->me_key = key;
+    entry->me_hash = hash;
+    entry->me_value = value;
+
+    mp->ma_fill += 1;
+    mp->ma_used += 1;
+}
+#endif
+
 NUITKA_MAY_BE_UNUSED static bool DICT_REMOVE_ITEM( PyObject *dict, PyObject *key )
 {
     int status = PyDict_DelItem( dict, key );
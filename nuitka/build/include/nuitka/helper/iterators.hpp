@@ -60,6 +60,51 @@ typedef struct {
     PyObject *it_seq;
 } seqiterobject;
 
+// Stolen from CPython implementation, the iterator of "xrange" objects, and of
+// "range" objects for Python3, so we can create and advance it directly.
+typedef struct {
+    PyObject_HEAD
+    long index;
+    long start;
+    long step;
+    long len;
+} rangeiterobject;
+
+// Stolen from CPython implementation, so we can access the iterators of "list"
+// and "tuple" objects directly.
+typedef struct {
+    PyObject_HEAD
+#if PYTHON_VERSION < 340
+    long      it_index;
+#else
+    Py_ssize_t it_index;
+#endif
+    PyListObject *it_seq;
+} listiterobject;
+
+typedef struct {
+    PyObject_HEAD
+#if PYTHON_VERSION < 340
+    long      it_index;
+#else
+    Py_ssize_t it_index;
+#endif
+    PyTupleObject *it_seq;
+} tupleiterobject;
+
+#if PYTHON_VERSION < 300
+// Not exported by CPython2, these are taken from objects at startup.
+extern PyTypeObject *Nuitka_RangeIterator_Type;
+extern PyTypeObject *Nuitka_ListIterator_Type;
+extern PyTypeObject *Nuitka_TupleIterator_Type;
+
+extern void _initIteratorTypes( void );
+#else
+#define Nuitka_RangeIterator_Type (&PyRangeIter_Type)
+#define Nuitka_ListIterator_Type (&PyListIter_Type)
+#define Nuitka_TupleIterator_Type (&PyTupleIter_Type)
+#endif
+
 NUITKA_MAY_BE_UNUSED static PyObject *MAKE_ITERATOR( PyObject *iterated )
 {
 
@@ -162,6 +207,173 @@ NUITKA_MAY_BE_UNUSED static PyObject *ITERATOR_NEXT( PyObject *iterator )
     return result;
 }
 
+// For loops over "range" and "xrange", the iterator is most often one of
+// ours, advance it without the call, otherwise do the normal thing.
+NUITKA_MAY_BE_UNUSED static PyObject *RANGE_ITERATOR_NEXT( PyObject *iterator )
+{
+    CHECK_OBJECT( iterator );
+
+    if (likely( Py_TYPE( iterator ) == Nuitka_RangeIterator_Type ))
+    {
+        rangeiterobject *range_iterator = (rangeiterobject *)iterator;
+
+        if ( range_iterator->index < range_iterator->len )
+        {
+            return PyInt_FromLong(
+                (long)( range_iterator->start + (unsigned long)( range_iterator->index++ ) * range_iterator->step )
+            );
+        }
+        else
+        {
+            return NULL;
+        }
+    }
+
+    return ITERATOR_NEXT( iterator );
+}
+
+// Advance "list" and "tuple" iterators without calling their slot, same as
+// CPython does it, i.e. a "list" growing while iterated is seen.
+NUITKA_MAY_BE_UNUSED static PyObject *LIST_ITERATOR_NEXT( listiterobject *iterator )
+{
+    PyListObject *list = iterator->it_seq;
+
+    if ( list == NULL )
+    {
+        return NULL;
+    }
+
+    if ( iterator->it_index < PyList_GET_SIZE( list ) )
+    {
+        PyObject *result = PyList_GET_ITEM( list, iterator->it_index );
+        iterator->it_index += 1;
+
+        return INCREASE_REFCOUNT( result );
+    }
+
+    iterator->it_seq = NULL;
+    Py_DECREF( list );
+
+    return NULL;
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *TUPLE_ITERATOR_NEXT( tupleiterobject *iterator )
+{
+    PyTupleObject *tuple = iterator->it_seq;
+
+    if ( tuple == NULL )
+    {
+        return NULL;
+    }
+
+    if ( iterator->it_index < PyTuple_GET_SIZE( tuple ) )
+    {
+        PyObject *result = PyTuple_GET_ITEM( tuple, iterator->it_index );
+        iterator->it_index += 1;
+
+        return INCREASE_REFCOUNT( result );
+    }
+
+    iterator->it_seq = NULL;
+    Py_DECREF( tuple );
+
+    return NULL;
+}
+
+// For loops, the iterator is most often one of a "list" or "tuple", check for
+// these before doing the generic thing.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOP_ITERATOR_NEXT( PyObject *iterator )
+{
+    CHECK_OBJECT( iterator );
+
+    if ( Py_TYPE( iterator ) == Nuitka_ListIterator_Type )
+    {
+        return LIST_ITERATOR_NEXT( (listiterobject *)iterator );
+    }
+    else if ( Py_TYPE( iterator ) == Nuitka_TupleIterator_Type )
+    {
+        return TUPLE_ITERATOR_NEXT( (tupleiterobject *)iterator );
+    }
+
+    return ITERATOR_NEXT( iterator );
+}
+
+// The number of items an iterator is going to give, for the iterators where
+// that can be told without running any code, otherwise 0.
+NUITKA_MAY_BE_UNUSED static Py_ssize_t ITERATOR_LENGTH_HINT( PyObject *iterator )
+{
+    CHECK_OBJECT( iterator );
+
+    Py_ssize_t result = 0;
+
+    if ( Py_TYPE( iterator ) == Nuitka_ListIterator_Type )
+    {
+        listiterobject *list_iterator = (listiterobject *)iterator;
+
+        if ( list_iterator->it_seq != NULL )
+        {
+            result = PyList_GET_SIZE( list_iterator->it_seq ) - list_iterator->it_index;
+        }
+    }
+    else if ( Py_TYPE( iterator ) == Nuitka_TupleIterator_Type )
+    {
+        tupleiterobject *tuple_iterator = (tupleiterobject *)iterator;
+
+        if ( tuple_iterator->it_seq != NULL )
+        {
+            result = PyTuple_GET_SIZE( tuple_iterator->it_seq ) - tuple_iterator->it_index;
+        }
+    }
+    else if ( Py_TYPE( iterator ) == Nuitka_RangeIterator_Type )
+    {
+        rangeiterobject *range_iterator = (rangeiterobject *)iterator;
+
+        result = range_iterator->len - range_iterator->index;
+    }
+
+    return result > 0 ? result : 0;
+}
+
+// Containers are not created for more items than this up front, the iteration
+// may stop early with an exception, and beyond this, growing costs little.
+#define NUITKA_PRESIZE_LIMIT (1 << 20)
+
+// Empty list with room for the items of the iterator, to be added with
+// "LIST_APPEND_ITEM".
+NUITKA_MAY_BE_UNUSED static PyObject *MAKE_LIST_FOR_ITERATOR( PyObject *iterator )
+{
+    Py_ssize_t size = ITERATOR_LENGTH_HINT( iterator );
+
+    if ( size > NUITKA_PRESIZE_LIMIT )
+    {
+        size = NUITKA_PRESIZE_LIMIT;
+    }
+
+    PyObject *result = PyList_New( size );
+    CHECK_OBJECT( result );
+
+    // The items are only allocated, not yet present.
+    Py_SIZE( result ) = 0;
+
+    return result;
+}
+
+// Empty dict with room for the items of the iterator.
+NUITKA_MAY_BE_UNUSED static PyObject *MAKE_DICT_FOR_ITERATOR( PyObject *iterator )
+{
+    Py_ssize_t size = ITERATOR_LENGTH_HINT( iterator );
+
+    if ( size > NUITKA_PRESIZE_LIMIT )
+    {
+        size = NUITKA_PRESIZE_LIMIT;
+    }
+
+    PyObject *result = _PyDict_NewPresized( size );
+    CHECK_OBJECT( result );
+
+    return result;
+}
+
 NUITKA_MAY_BE_UNUSED static PyObject *BUILTIN_NEXT1( PyObject *iterator )
 {
     CHECK_OBJECT( iterator );
@@ -33,6 +33,139 @@ static inline bool IS_SANE_TYPE( PyTypeObject *type )
 extern PyObject *MY_RICHCOMPARE( PyObject *v, PyObject *w, int op );
 extern PyObject *MY_RICHCOMPARE_NORECURSE( PyObject *v, PyObject *w, int op );
 
+// Compare two C values according to a rich comparison operation, which is
+// typically a constant, so this reduces to a single comparison.
+#define COMPARE_VALUES_BOOL( a, b, op ) \
+    ( \
+        (op) == Py_LT ? (a) <  (b) : \
+        (op) == Py_LE ? (a) <= (b) : \
+        (op) == Py_EQ ? (a) == (b) : \
+        (op) == Py_NE ? (a) != (b) : \
+        (op) == Py_GT ? (a) >  (b) : \
+                        (a) >= (b)   \
+    )
+
+#if PYTHON_VERSION < 300
+#define IS_FAST_INT( value ) ( Py_TYPE( value ) == &PyInt_Type )
+#define FAST_INT_VALUE( value ) PyInt_AS_LONG( value )
+#else
+// Only values with at most a single digit, these have their value directly.
+#define IS_FAST_INT( value ) ( Py_TYPE( value ) == &PyLong_Type && Py_SIZE( value ) >= -1 && Py_SIZE( value ) <= 1 )
+#define FAST_INT_VALUE( value ) ( (long)Py_SIZE( value ) * (long)( (PyLongObject *)value )->ob_digit[0] )
+#endif
+
+// Integer values of this many bits convert to "double" exactly, which is what
+// CPython also requires to compare them with a "float" directly.
+#define FAST_INT_FLOAT_LIMIT (1L << 48)
+
+// Compare values of well known types directly, without creating a result
+// object. Returns "false" for types not handled, these must then take the
+// normal path.
+NUITKA_MAY_BE_UNUSED static inline bool RICH_COMPARE_BOOL_FAST( PyObject *operand1, PyObject *operand2, int op, int *result )
+{
+    PyTypeObject *type1 = Py_TYPE( operand1 );
+    PyTypeObject *type2 = Py_TYPE( operand2 );
+
+    if ( IS_FAST_INT( operand1 ) )
+    {
+        if ( IS_FAST_INT( operand2 ) )
+        {
+            *result = COMPARE_VALUES_BOOL( FAST_INT_VALUE( operand1 ), FAST_INT_VALUE( operand2 ), op );
+            return true;
+        }
+
+        if ( type2 == &PyFloat_Type )
+        {
+            long value1 = FAST_INT_VALUE( operand1 );
+
+            if ( value1 < FAST_INT_FLOAT_LIMIT && value1 > -FAST_INT_FLOAT_LIMIT )
+            {
+                *result = COMPARE_VALUES_BOOL( (double)value1, PyFloat_AS_DOUBLE( operand2 ), op );
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    if ( type1 == &PyFloat_Type )
+    {
+        if ( type2 == &PyFloat_Type )
+        {
+            *result = COMPARE_VALUES_BOOL( PyFloat_AS_DOUBLE( operand1 ), PyFloat_AS_DOUBLE( operand2 ), op );
+            return true;
+        }
+
+        if ( IS_FAST_INT( operand2 ) )
+        {
+            long value2 = FAST_INT_VALUE( operand2 );
+
+            if ( value2 < FAST_INT_FLOAT_LIMIT && value2 > -FAST_INT_FLOAT_LIMIT )
+            {
+                *result = COMPARE_VALUES_BOOL( PyFloat_AS_DOUBLE( operand1 ), (double)value2, op );
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    if ( type1 != type2 )
+    {
+        return false;
+    }
+
+    if ( type1 == &PyBytes_Type )
+    {
+        Py_ssize_t size1 = PyBytes_GET_SIZE( operand1 );
+        Py_ssize_t size2 = PyBytes_GET_SIZE( operand2 );
+
+        if ( op == Py_EQ || op == Py_NE )
+        {
+            bool equal = size1 == size2 && memcmp( PyBytes_AS_STRING( operand1 ), PyBytes_AS_STRING( operand2 ), size1 ) == 0;
+
+            *result = ( op == Py_EQ ) == equal;
+            return true;
+        }
+
+        int cmp = memcmp( PyBytes_AS_STRING( operand1 ), PyBytes_AS_STRING( operand2 ), size1 < size2 ? size1 : size2 );
+
+        if ( cmp == 0 )
+        {
+            cmp = size1 < size2 ? -1 : ( size1 > size2 ? 1 : 0 );
+        }
+
+        *result = COMPARE_VALUES_BOOL( cmp, 0, op );
+        return true;
+    }
+
+    // For unicode, only equality is done here, ordering is more complex.
+    if ( type1 == &PyUnicode_Type && ( op == Py_EQ || op == Py_NE ) )
+    {
+#if PYTHON_VERSION < 330
+        Py_ssize_t size = PyUnicode_GET_SIZE( operand1 );
+
+        bool equal = size == PyUnicode_GET_SIZE( operand2 ) && memcmp( PyUnicode_AS_UNICODE( operand1 ), PyUnicode_AS_UNICODE( operand2 ), size * sizeof( Py_UNICODE ) ) == 0;
+#else
+        if ( unlikely( PyUnicode_READY( operand1 ) == -1 || PyUnicode_READY( operand2 ) == -1 ) )
+        {
+            PyErr_Clear();
+            return false;
+        }
+
+        Py_ssize_t size = PyUnicode_GET_LENGTH( operand1 );
+        int kind = PyUnicode_KIND( operand1 );
+
+        bool equal = size == PyUnicode_GET_LENGTH( operand2 ) && kind == PyUnicode_KIND( operand2 ) && memcmp( PyUnicode_DATA( operand1 ), PyUnicode_DATA( operand2 ), size * kind ) == 0;
+#endif
+
+        *result = ( op == Py_EQ ) == equal;
+        return true;
+    }
+
+    return false;
+}
+
 NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_LT( PyObject *operand1, PyObject *operand2 )
 {
     PyObject *result = MY_RICHCOMPARE( operand1, operand2, Py_LT );
@@ -116,6 +249,13 @@ NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_GE( PyObject *operand1, PyObj
 
 NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_LT( PyObject *operand1, PyObject *operand2 )
 {
+    int result;
+
+    if ( RICH_COMPARE_BOOL_FAST( operand1, operand2, Py_LT, &result ) )
+    {
+        return result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_LT );
 
     if (unlikely( rich_result == NULL ))
@@ -123,8 +263,6 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_LT( PyObject *operand1, PyObje
         return -1;
     }
 
-    int result;
-
     // Doing the quick tests on the outside spares the function call, with
     // "partial inline" this should become unneeded.
     if ( rich_result == Py_True )
@@ -153,6 +291,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_LE( PyObject *operand1, PyObje
         return 1;
     }
 
+    int result;
+
+    if ( RICH_COMPARE_BOOL_FAST( operand1, operand2, Py_LE, &result ) )
+    {
+        return result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_LE );
 
     if (unlikely( rich_result == NULL ))
@@ -160,8 +305,6 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_LE( PyObject *operand1, PyObje
         return -1;
     }
 
-    int result;
-
     // Doing the quick tests on the outside spares the function call, with
     // "partial inline" this should become unneeded.
     if ( rich_result == Py_True )
@@ -190,6 +333,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_EQ( PyObject *operand1, PyObje
         return 1;
     }
 
+    int result;
+
+    if ( RICH_COMPARE_BOOL_FAST( operand1, operand2, Py_EQ, &result ) )
+    {
+        return result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_EQ );
 
     if (unlikely( rich_result == NULL ))
@@ -197,8 +347,6 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_EQ( PyObject *operand1, PyObje
         return -1;
     }
 
-    int result;
-
     // Doing the quick tests on the outside spares the function call, with
     // "partial inline" this should become unneeded.
     if ( rich_result == Py_True )
@@ -227,6 +375,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_EQ_NORECURSE( PyObject *operan
         return 1;
     }
 
+    int result;
+
+    if ( RICH_COMPARE_BOOL_FAST( operand1, operand2, Py_EQ, &result ) )
+    {
+        return result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE_NORECURSE( operand1, operand2, Py_EQ );
 
     if (unlikely( rich_result == NULL ))
@@ -234,8 +389,6 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_EQ_NORECURSE( PyObject *operan
         return -1;
     }
 
-    int result;
-
     // Doing the quick tests on the outside spares the function call, with
     // "partial inline" this should become unneeded.
     if ( rich_result == Py_True )
@@ -265,6 +418,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_NE( PyObject *operand1, PyObje
         return 0;
     }
 
+    int result;
+
+    if ( RICH_COMPARE_BOOL_FAST( operand1, operand2, Py_NE, &result ) )
+    {
+        return result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_NE );
 
     if (unlikely( rich_result == NULL ))
@@ -272,8 +432,6 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_NE( PyObject *operand1, PyObje
         return -1;
     }
 
-    int result;
-
     // Doing the quick tests on the outside spares the function call, with
     // "partial inline" this should become unneeded.
     if ( rich_result == Py_True )
@@ -296,6 +454,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_NE( PyObject *operand1, PyObje
 
 NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_GT( PyObject *operand1, PyObject *operand2 )
 {
+    int result;
+
+    if ( RICH_COMPARE_BOOL_FAST( operand1, operand2, Py_GT, &result ) )
+    {
+        return result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_GT );
 
     if (unlikely( rich_result == NULL ))
@@ -303,8 +468,6 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_GT( PyObject *operand1, PyObje
         return -1;
     }
 
-    int result;
-
     // Doing the quick tests on the outside spares the function call, with
     // "partial inline" this should become unneeded.
     if ( rich_result == Py_True )
@@ -333,6 +496,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_GE( PyObject *operand1, PyObje
         return 1;
     }
 
+    int result;
+
+    if ( RICH_COMPARE_BOOL_FAST( operand1, operand2, Py_GE, &result ) )
+    {
+        return result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_GE );
 
     if (unlikely( rich_result == NULL ))
@@ -340,8 +510,6 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_GE( PyObject *operand1, PyObje
         return -1;
     }
 
-    int result;
-
     // Doing the quick tests on the outside spares the function call, with
     // "partial inline" this should become unneeded.
     if ( rich_result == Py_True )
@@ -111,4 +111,26 @@ NUITKA_MAY_BE_UNUSED static bool SEQUENCE_SETITEM( PyObject *sequence, Py_ssize_
     }
 }
 
+// Like "PyList_Append", but with room left in the list, e.g. as it was created
+// for a known number of items, no call or resize is done.
+NUITKA_MAY_BE_UNUSED static int LIST_APPEND_ITEM( PyObject *list, PyObject *item )
+{
+    CHECK_OBJECT( list );
+    CHECK_OBJECT( item );
+
+    PyListObject *list_object = (PyListObject *)list;
+    Py_ssize_t size = Py_SIZE( list_object );
+
+    if ( size < list_object->allocated )
+    {
+        Py_INCREF( item );
+        list_object->ob_item[ size ] = item;
+        Py_SIZE( list_object ) = size + 1;
+
+        return 0;
+    }
+
+    return PyList_Append( list, item );
+}
+
 #endif
@@ -565,6 +565,10 @@ extern PyObject *BUILTIN_RANGE( PyObject *boundary );
 
 extern PyObject *BUILTIN_XRANGE( PyObject *low, PyObject *high, PyObject *step );
 
+// For iterating over range() and xrange() without creating them.
+extern PyObject *MAKE_RANGE_ITERATOR( PyObject *low, PyObject *high, PyObject *step );
+extern PyObject *MAKE_XRANGE_ITERATOR( PyObject *low, PyObject *high, PyObject *step );
+
 // For built-in built-in len() functionality.
 extern PyObject *BUILTIN_LEN( PyObject *boundary );
 
@@ -828,6 +828,194 @@ PyObject *BUILTIN_XRANGE( PyObject *low, PyObject *high, PyObject *step )
 }
 #endif
 
+#if PYTHON_VERSION < 300
+PyTypeObject *Nuitka_RangeIterator_Type = NULL;
+PyTypeObject *Nuitka_ListIterator_Type = NULL;
+PyTypeObject *Nuitka_TupleIterator_Type = NULL;
+
+static PyTypeObject *GET_ITERATOR_TYPE( PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    PyObject *iterator = PyObject_GetIter( value );
+    CHECK_OBJECT( iterator );
+
+    PyTypeObject *result = Py_TYPE( iterator );
+
+    Py_DECREF( iterator );
+    Py_DECREF( value );
+
+    return result;
+}
+
+void _initIteratorTypes( void )
+{
+    // The types are not exported by CPython2, take them from empty objects.
+    Nuitka_RangeIterator_Type = GET_ITERATOR_TYPE(
+        PyObject_CallFunction( (PyObject *)&PyRange_Type, (char *)"l", 0L )
+    );
+    Nuitka_ListIterator_Type = GET_ITERATOR_TYPE( PyList_New( 0 ) );
+    Nuitka_TupleIterator_Type = GET_ITERATOR_TYPE( PyTuple_New( 0 ) );
+}
+#endif
+
+static bool TO_RANGE_BOUNDARY( PyObject *value, long *result )
+{
+#if PYTHON_VERSION < 300
+    if ( PyInt_Check( value ) )
+    {
+        *result = PyInt_AS_LONG( value );
+        return true;
+    }
+#endif
+
+    if ( PyLong_Check( value ) )
+    {
+        *result = PyLong_AsLong( value );
+
+        if (unlikely( *result == -1 && ERROR_OCCURRED() ))
+        {
+            CLEAR_ERROR_OCCURRED();
+            return false;
+        }
+
+        return true;
+    }
+
+    return false;
+}
+
+// Create the iterator of a range directly, without creating the list or range
+// object first. Returns NULL without an error set, if the values are not C
+// longs, in which case the generic way needs to be used, which also gives the
+// errors.
+static PyObject *_MAKE_RANGE_ITERATOR( PyObject *low, PyObject *high, PyObject *step )
+{
+    long start = 0;
+    long stop;
+    long step_value = 1;
+
+    if ( high == NULL )
+    {
+        if ( !TO_RANGE_BOUNDARY( low, &stop ) )
+        {
+            return NULL;
+        }
+    }
+    else
+    {
+        if ( !TO_RANGE_BOUNDARY( low, &start ) || !TO_RANGE_BOUNDARY( high, &stop ) )
+        {
+            return NULL;
+        }
+
+        if ( step != NULL && !TO_RANGE_BOUNDARY( step, &step_value ) )
+        {
+            return NULL;
+        }
+
+        if ( step_value == 0 )
+        {
+            return NULL;
+        }
+    }
+
+    unsigned long length;
+
+    if ( step_value > 0 && start < stop )
+    {
+        length = 1UL + ( stop - 1UL - start ) / step_value;
+    }
+    else if ( step_value < 0 && start > stop )
+    {
+        length = 1UL + ( start - 1UL - stop ) / ( 0UL - step_value );
+    }
+    else
+    {
+        length = 0;
+    }
+
+    // The values are all between start and stop, but the length may not be
+    // a C long.
+    if (unlikely( length > (unsigned long)LONG_MAX ))
+    {
+        return NULL;
+    }
+
+    rangeiterobject *result = PyObject_New( rangeiterobject, Nuitka_RangeIterator_Type );
+
+    if (unlikely( result == NULL ))
+    {
+        return NULL;
+    }
+
+    result->index = 0;
+    result->start = start;
+    result->step = step_value;
+    result->len = (long)length;
+
+    return (PyObject *)result;
+}
+
+PyObject *MAKE_RANGE_ITERATOR( PyObject *low, PyObject *high, PyObject *step )
+{
+    PyObject *result = _MAKE_RANGE_ITERATOR( low, high, step );
+
+    if ( result != NULL || ERROR_OCCURRED() )
+    {
+        return result;
+    }
+
+    PyObject *range_value;
+
+    if ( high == NULL )
+    {
+        range_value = BUILTIN_RANGE( low );
+    }
+    else if ( step == NULL )
+    {
+        range_value = BUILTIN_RANGE2( low, high );
+    }
+    else
+    {
+        range_value = BUILTIN_RANGE3( low, high, step );
+    }
+
+    if (unlikely( range_value == NULL ))
+    {
+        return NULL;
+    }
+
+    result = MAKE_ITERATOR( range_value );
+    Py_DECREF( range_value );
+
+    return result;
+}
+
+#if PYTHON_VERSION < 300
+PyObject *MAKE_XRANGE_ITERATOR( PyObject *low, PyObject *high, PyObject *step )
+{
+    PyObject *result = _MAKE_RANGE_ITERATOR( low, high, step );
+
+    if ( result != NULL || ERROR_OCCURRED() )
+    {
+        return result;
+    }
+
+    PyObject *xrange_value = BUILTIN_XRANGE( low, high, step );
+
+    if (unlikely( xrange_value == NULL ))
+    {
+        return NULL;
+    }
+
+    result = MAKE_ITERATOR( xrange_value );
+    Py_DECREF( xrange_value );
+
+    return result;
+}
+#endif
+
 PyObject *BUILTIN_LEN( PyObject *value )
 {
     CHECK_OBJECT( value );
@@ -1945,7 +2133,7 @@ PyObject *BUILTIN_SETATTR( PyObject *object, PyObject *attribute, PyObject *valu
         return NULL;
     }
 
-    return BOOL_FROM( res == 0 );
+    return Py_None;
 }
 
 PyDictObject *dict_builtin = NULL;
@@ -4060,7 +4248,96 @@ Py_hash_t DEEP_HASH( PyObject *value )
 
 #if _NUITKA_PROFILE
 
-timespec diff(timespec start, timespec end);
+#include <pthread.h>
+#include <signal.h>
+#include <sys/time.h>
+
+// Native sampling profiler. A timer signal interrupts the program regularly,
+// and the stack of compiled frames of the profiled thread is recorded. At the
+// end, the samples are counted per stack, and written as collapsed stacks,
+// which e.g. "flamegraph.pl" can render. Only compiled frames are recorded,
+// their code objects are constants that live as long as the program, so they
+// can be remembered without holding a reference.
+
+// Sampling interval in micro seconds.
+#define NUITKA_PROFILE_INTERVAL 1000
+// Deeper stacks are cut off at the innermost frames.
+#define NUITKA_PROFILE_MAX_DEPTH 256
+// Number of entries the samples may use, if full, samples are dropped.
+#define NUITKA_PROFILE_BUFFER_SIZE ( 1 << 22 )
+
+// A sample is a header entry with "code" being NULL and "line" the number
+// of frame entries that follow, innermost frame first.
+struct Nuitka_ProfileEntry
+{
+    PyCodeObject *code;
+    int line;
+};
+
+static struct Nuitka_ProfileEntry *profile_buffer;
+static size_t profile_buffer_used;
+static unsigned long profile_samples_dropped;
+
+static PyThreadState *profile_thread_state;
+static pthread_t profile_thread;
+
+static struct sigaction profile_old_action;
+
+static void sampleProfile( int signal_number )
+{
+    // Only the thread that started profiling is sampled, its frames can only
+    // change when it runs, which it doesn't while we are here.
+    if ( !pthread_equal( pthread_self(), profile_thread ) )
+    {
+        return;
+    }
+
+    size_t depth = 0;
+
+    for ( PyFrameObject *frame = profile_thread_state->frame; frame != NULL; frame = frame->f_back )
+    {
+        if ( Nuitka_Frame_Check( (PyObject *)frame ) )
+        {
+            depth += 1;
+
+            if ( depth == NUITKA_PROFILE_MAX_DEPTH )
+            {
+                break;
+            }
+        }
+    }
+
+    if ( depth == 0 )
+    {
+        return;
+    }
+
+    if (unlikely( profile_buffer_used + depth + 1 > NUITKA_PROFILE_BUFFER_SIZE ))
+    {
+        profile_samples_dropped += 1;
+        return;
+    }
+
+    struct Nuitka_ProfileEntry *entry = &profile_buffer[ profile_buffer_used ];
+
+    entry->code = NULL;
+    entry->line = (int)depth;
+    entry += 1;
+
+    for ( PyFrameObject *frame = profile_thread_state->frame; depth > 0; frame = frame->f_back )
+    {
+        if ( Nuitka_Frame_Check( (PyObject *)frame ) )
+        {
+            entry->code = frame->f_code;
+            entry->line = frame->f_lineno;
+            entry += 1;
+
+            depth -= 1;
+        }
+    }
+
+    profile_buffer_used = entry - profile_buffer;
+}
 
 static timespec getTimespecDiff( timespec start, timespec end )
 {
@@ -4080,57 +4357,141 @@ static timespec getTimespecDiff( timespec start, timespec end )
     return temp;
 }
 
-static FILE *tempfile_profile;
-static PyObject *vmprof_module;
-
 static timespec time1, time2;
 
 void startProfiling( void )
 {
-    tempfile_profile = fopen("nuitka-performance.dat", "wb");
+    profile_buffer = (struct Nuitka_ProfileEntry *)malloc( NUITKA_PROFILE_BUFFER_SIZE * sizeof( struct Nuitka_ProfileEntry ) );
+    assert( profile_buffer != NULL );
+
+    profile_buffer_used = 0;
+    profile_samples_dropped = 0;
+
+    profile_thread_state = PyThreadState_GET();
+    profile_thread = pthread_self();
+
+    struct sigaction action;
+    memset( &action, 0, sizeof( action ) );
+
+    action.sa_handler = sampleProfile;
+    action.sa_flags = SA_RESTART;
+    sigemptyset( &action.sa_mask );
 
-    // Might be necessary to import "site" module to find "vmprof", lets just
-    // hope we don't suffer too much from that. If we do, what might be done
-    // is to try and just have the "PYTHONPATH" from it from out user.
-    PyImport_ImportModule( "site" );
-    vmprof_module = PyImport_ImportModule( "vmprof" );
+    sigaction( SIGPROF, &action, &profile_old_action );
 
-    // Abort if it's not there.
-    if ( vmprof_module == NULL )
+    struct itimerval timer;
+    timer.it_interval.tv_sec = 0;
+    timer.it_interval.tv_usec = NUITKA_PROFILE_INTERVAL;
+    timer.it_value = timer.it_interval;
+
+    setitimer( ITIMER_PROF, &timer, NULL );
+
+    clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &time1);
+}
+
+// Describe the sample starting at "entry" as a collapsed stack, outermost
+// frame first, i.e. "file:function:line;file:function:line".
+static void formatProfileSample( struct Nuitka_ProfileEntry *entry, char *buffer, size_t buffer_size )
+{
+    assert( entry->code == NULL );
+
+    int depth = entry->line;
+    size_t used = 0;
+
+    buffer[0] = 0;
+
+    for ( int i = depth; i > 0 && used < buffer_size; i-- )
     {
-        PyErr_Print();
-        abort();
+        PyCodeObject *code = entry[ i ].code;
+
+        int res = snprintf(
+            buffer + used,
+            buffer_size - used,
+            "%s%s:%s:%d",
+            i == depth ? "" : ";",
+            Nuitka_String_AsString( code->co_filename ),
+            Nuitka_String_AsString( code->co_name ),
+            entry[ i ].line
+        );
+
+        if ( res < 0 )
+        {
+            break;
+        }
+
+        used += res;
+    }
+}
+
+static void writeProfile( char const *filename )
+{
+    // Count the samples per stack.
+    PyObject *counts = PyDict_New();
+    unsigned long sample_count = 0;
+
+    static char stack_buffer[ 65536 ];
+
+    for ( size_t i = 0; i < profile_buffer_used; i += profile_buffer[ i ].line + 1 )
+    {
+        formatProfileSample( &profile_buffer[ i ], stack_buffer, sizeof( stack_buffer ) );
+
+        PyObject *stack = PyBytes_FromString( stack_buffer );
+        PyObject *count = PyDict_GetItem( counts, stack );
+
+        PyObject *new_count = PyInt_FromLong( count ? PyInt_AsLong( count ) + 1 : 1 );
+        PyDict_SetItem( counts, stack, new_count );
+
+        Py_DECREF( new_count );
+        Py_DECREF( stack );
+
+        sample_count += 1;
     }
 
-    PyObject *result = CALL_FUNCTION_WITH_ARGS1(
-        PyObject_GetAttrString( vmprof_module, "enable"),
-         PyInt_FromLong( fileno( tempfile_profile ) )
-    );
+    FILE *profile_file = fopen( filename, "wb" );
 
-    if ( result == NULL ) {
-        PyErr_Print();
-        abort();
+    if ( profile_file != NULL )
+    {
+        Py_ssize_t pos = 0;
+        PyObject *stack, *count;
+
+        while ( PyDict_Next( counts, &pos, &stack, &count ) )
+        {
+            fprintf( profile_file, "%s %ld\n", PyBytes_AS_STRING( stack ), PyInt_AsLong( count ) );
+        }
+
+        fclose( profile_file );
     }
 
-    clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &time1);
+    Py_DECREF( counts );
+
+    fprintf(
+        stderr,
+        "Nuitka: Profile with %lu samples (%lu dropped) written to '%s'.\n",
+        sample_count,
+        profile_samples_dropped,
+        filename
+    );
 }
 
 void stopProfiling( void )
 {
     clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &time2);
 
+    struct itimerval timer;
+    memset( &timer, 0, sizeof( timer ) );
+
+    setitimer( ITIMER_PROF, &timer, NULL );
+    sigaction( SIGPROF, &profile_old_action, NULL );
+
     // Save the current exception, if any, we must preserve it.
     PyObject *save_exception_type, *save_exception_value;
     PyTracebackObject *save_exception_tb;
     FETCH_ERROR_OCCURRED( &save_exception_type, &save_exception_value, &save_exception_tb );
 
-    PyObject *result = CALL_FUNCTION_NO_ARGS(
-        PyObject_GetAttrString( vmprof_module, "disable")
-    );
-
-    if ( result == NULL ) PyErr_Clear();
+    writeProfile( "nuitka-profile.txt" );
 
-    fclose( tempfile_profile );
+    free( profile_buffer );
+    profile_buffer = NULL;
 
     FILE *tempfile_times = fopen( "nuitka-times.dat", "wb" );
 
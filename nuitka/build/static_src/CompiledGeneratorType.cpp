@@ -155,7 +155,24 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
         // Continue the yielder function while preventing recursion.
         generator->m_running = true;
 
-        swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
+#if PYTHON_VERSION >= 330
+        // When suspended in a "yield from" of a compiled generator, that one
+        // can be resumed directly, and only once it has finished, we need to
+        // continue our own context, to deal with its result.
+        if ( generator->m_delegate != NULL && generator->m_exception_type == NULL )
+        {
+            generator->m_yielded = Nuitka_Generator_send( (Nuitka_GeneratorObject *)generator->m_delegate, value );
+
+            if ( generator->m_yielded == NULL )
+            {
+                swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
+            }
+        }
+        else
+#endif
+        {
+            swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
+        }
 
         generator->m_running = false;
 
@@ -725,6 +742,10 @@ PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyObject *qua
     result->m_weakrefs = NULL;
 
     result->m_status = status_Unused;
+
+#if PYTHON_VERSION >= 330
+    result->m_delegate = NULL;
+#endif
     result->m_running = false;
 
     result->m_exception_type = NULL;
@@ -1046,15 +1067,42 @@ PyObject *YIELD_FROM( Nuitka_GeneratorObject *generator, PyObject *value )
 #if PYTHON_VERSION >= 350
             generator->m_yieldfrom = value;
 #endif
+            // Compiled generators get resumed directly, until they finish.
+            if ( Nuitka_Generator_Check( value ) )
+            {
+                generator->m_delegate = value;
+            }
+
             // Return to the calling context.
             swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
 
+            generator->m_delegate = NULL;
+
 #if PYTHON_VERSION >= 350
             generator->m_yieldfrom = NULL;
 #endif
 
             send_value = generator->m_yielded;
 
+            // The delegate was resumed directly and has finished, with its
+            // return value or error set.
+            if ( send_value == NULL )
+            {
+                PyObject *error = GET_ERROR_OCCURRED();
+
+                if ( error == NULL )
+                {
+                    return INCREASE_REFCOUNT( Py_None );
+                }
+
+                if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
+                {
+                    return ERROR_GET_STOP_ITERATION_VALUE();
+                }
+
+                return NULL;
+            }
+
             CHECK_OBJECT( send_value );
         }
     }
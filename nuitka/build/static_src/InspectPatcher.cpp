@@ -23,7 +23,6 @@
 
 #if PYTHON_VERSION >= 300
 extern PyObject *const_str_plain_inspect;
-extern PyObject *const_str_plain_site;
 extern PyObject *const_int_0;
 
 static PyObject *module_inspect;
@@ -79,32 +78,10 @@ static PyMethodDef _method_def_inspect_getgeneratorstate_replacement =
 };
 
 // Replace inspect functions with ones that accept compiled types too.
-static void patchInspectModule( void )
+static void patchInspectModuleObject( PyObject *module )
 {
-#if PYTHON_VERSION >= 300
-#ifdef _NUITKA_EXE
-    // May need to import the "site" module, because otherwise the patching can
-    // fail with it being unable to load it.
-    if ( Py_NoSiteFlag == 0 )
-    {
-        PyObject *site_module = IMPORT_MODULE( const_str_plain_site, Py_None, Py_None, const_tuple_empty, const_int_0 );
-
-        if ( site_module == NULL )
-        {
-            // Ignore ImportError, site is not a must.
-            CLEAR_ERROR_OCCURRED();
-        }
-    }
-#endif
-
-    module_inspect = IMPORT_MODULE( const_str_plain_inspect, Py_None, Py_None, const_tuple_empty, const_int_0 );
-
-    if ( module_inspect == NULL )
-    {
-        PyErr_PrintEx( 0 );
-        Py_Exit( 1 );
-    }
-    CHECK_OBJECT( module_inspect );
+    module_inspect = module;
+    Py_INCREF( module_inspect );
 
     // Patch "inspect.getgeneratorstate" unless it is already patched.
     old_getgeneratorstate = PyObject_GetAttrString( module_inspect, "getgeneratorstate" );
@@ -117,8 +94,165 @@ static void patchInspectModule( void )
 
         PyObject_SetAttrString( module_inspect, "getgeneratorstate", inspect_getgeneratorstate_replacement );
     }
-#endif
+}
+
+// The "inspect" module is big and pulls in a lot of other modules, so it is
+// only patched when something imports it. This "sys.meta_path" finder claims
+// it, lets the other finders do the actual import, and then patches it.
+static PyObject *inspect_patching_finder = NULL;
+static bool inspect_importing = false;
+
+static char *_kwlist_finder[] = {
+    (char *)"fullname",
+    (char *)"unused",
+    NULL
+};
+
+static PyObject *_inspect_patcher_find_module( PyObject *self, PyObject *args, PyObject *kwds )
+{
+    PyObject *module_name;
+    PyObject *unused;
+
+    int res = PyArg_ParseTupleAndKeywords(
+        args,
+        kwds,
+        "O|O:find_module",
+        _kwlist_finder,
+        &module_name,
+        &unused
+    );
+
+    if (unlikely( res == 0 ))
+    {
+        return NULL;
+    }
+
+    // While we import it ourselves, the other finders are responsible.
+    if ( inspect_importing == false &&
+         Nuitka_String_Check( module_name ) &&
+         strcmp( Nuitka_String_AsString( module_name ), "inspect" ) == 0 )
+    {
+        return INCREASE_REFCOUNT( inspect_patching_finder );
+    }
+
+    return INCREASE_REFCOUNT( Py_None );
+}
+
+static PyObject *_inspect_patcher_load_module( PyObject *self, PyObject *args, PyObject *kwds )
+{
+    PyObject *module_name;
+    PyObject *unused;
+
+    int res = PyArg_ParseTupleAndKeywords(
+        args,
+        kwds,
+        "O|O:load_module",
+        _kwlist_finder,
+        &module_name,
+        &unused
+    );
+
+    if (unlikely( res == 0 ))
+    {
+        return NULL;
+    }
+
+    inspect_importing = true;
+    PyObject *module = IMPORT_MODULE( const_str_plain_inspect, Py_None, Py_None, const_tuple_empty, const_int_0 );
+    inspect_importing = false;
+
+    if (unlikely( module == NULL ))
+    {
+        return NULL;
+    }
+
+    patchInspectModuleObject( module );
+
+    // Our work is done, no need to be asked about other imports anymore.
+    PyObject *result = PyObject_CallMethod( PySys_GetObject( (char *)"meta_path" ), (char *)"remove", (char *)"O", inspect_patching_finder );
+
+    if ( result == NULL )
+    {
+        // Somebody else modified it, not our problem.
+        CLEAR_ERROR_OCCURRED();
+    }
+    else
+    {
+        Py_DECREF( result );
+    }
+
+    return module;
+}
+
+static PyMethodDef _method_def_inspect_patcher_find_module =
+{
+    "find_module",
+    (PyCFunction)_inspect_patcher_find_module,
+    METH_VARARGS | METH_KEYWORDS,
+    NULL
+};
+
+static PyMethodDef _method_def_inspect_patcher_load_module =
+{
+    "load_module",
+    (PyCFunction)_inspect_patcher_load_module,
+    METH_VARARGS | METH_KEYWORDS,
+    NULL
+};
+
+static void patchInspectModule( void )
+{
+    // Already imported, e.g. by the host of an extension module, then patch
+    // it right away.
+    PyObject *module = PyDict_GetItem( PyImport_GetModuleDict(), const_str_plain_inspect );
+
+    if ( module != NULL )
+    {
+        patchInspectModuleObject( module );
+        return;
+    }
 
+    PyObject *method_dict = PyDict_New();
+    CHECK_OBJECT( method_dict );
+
+    PyObject *finder_find_module = PyCFunction_New(
+        &_method_def_inspect_patcher_find_module,
+        NULL
+    );
+    CHECK_OBJECT( finder_find_module );
+    PyDict_SetItemString( method_dict, "find_module", finder_find_module );
+    Py_DECREF( finder_find_module );
+
+    PyObject *finder_load_module = PyCFunction_New(
+        &_method_def_inspect_patcher_load_module,
+        NULL
+    );
+    CHECK_OBJECT( finder_load_module );
+    PyDict_SetItemString( method_dict, "load_module", finder_load_module );
+    Py_DECREF( finder_load_module );
+
+    PyObject *finder_name = PyUnicode_FromString( "_nuitka_inspect_patcher" );
+    CHECK_OBJECT( finder_name );
+
+    inspect_patching_finder = PyObject_CallFunctionObjArgs(
+        (PyObject *)&PyType_Type,
+        finder_name,
+        const_tuple_empty,
+        method_dict,
+        NULL
+    );
+
+    Py_DECREF( finder_name );
+    Py_DECREF( method_dict );
+
+    CHECK_OBJECT( inspect_patching_finder );
+
+    int res = PyList_Insert(
+        PySys_GetObject( (char *)"meta_path" ),
+        0,
+        inspect_patching_finder
+    );
+    assert( res == 0 );
 }
 #endif
 
@@ -70,14 +70,22 @@ def getAttributeLookupCode(to_name, source_name, attribute_name, needs_check,
             )
         )
     else:
+        cache_name = context.allocateAttributeCacheName()
+
+        context.addDeclaration(
+            cache_name,
+            "static struct Nuitka_AttributeCache %s;" % cache_name
+        )
+
         emit(
-            "%s = LOOKUP_ATTRIBUTE( %s, %s );" % (
+            "%s = LOOKUP_ATTRIBUTE_CACHED( %s, %s, &%s );" % (
                 to_name,
                 source_name,
                 getConstantCode(
                     context  = context,
                     constant = attribute_name
-                )
+                ),
+                cache_name
             )
         )
 
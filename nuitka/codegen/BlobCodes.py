@@ -22,15 +22,30 @@ efficiently. The "StreamData" class is used in two places, for constants
 and for freezing of bytecode.
 """
 
+# Values larger than this are only shared with equal values. Searching the
+# whole stream for them, e.g. for frozen bytecode of modules, is too slow.
+_max_search_size = 1024
+
+
 class StreamData:
     def __init__(self):
-        self.stream_data = bytes()
+        # Appending to a "bytes" object copies all of it every time.
+        self.stream_data = bytearray()
+
+        self.large_values = {}
 
     def getStreamDataCode(self, value, fixed_size = False):
-        offset = self.stream_data.find(value)
+        if len(value) > _max_search_size:
+            offset = self.large_values.get(value, -1)
+        else:
+            offset = self.stream_data.find(value)
+
         if offset == -1:
             offset = len(self.stream_data)
-            self.stream_data += value
+            self.stream_data.extend(value)
+
+            if len(value) > _max_search_size:
+                self.large_values[value] = offset
 
         if fixed_size:
             return "&constant_bin[ %d ]" % offset
@@ -41,4 +56,4 @@ class StreamData:
             )
 
     def getBytes(self):
-        return self.stream_data
+        return bytes(self.stream_data)
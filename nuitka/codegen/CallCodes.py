@@ -23,17 +23,19 @@ able to execute them without creating the argument dictionary at all.
 
 """
 
-from .ConstantCodes import getConstantAccess
+from .ConstantCodes import getConstantAccess, getConstantCode
 from .ErrorCodes import getErrorExitCode, getReleaseCode, getReleaseCodes
 from .ExceptionCodes import getExceptionIdentifier
 from .Helpers import generateChildExpressionCode
 from .LineNumberCodes import emitLineNumberUpdateCode
 from .templates.CodeTemplatesCalls import (
     template_call_function_with_args_decl,
-    template_call_function_with_args_impl
+    template_call_function_with_args_impl,
+    template_call_method_with_args_impl
 )
 from .templates.CodeTemplatesModules import (
     template_header_guard,
+    template_helper_decl,
     template_helper_impl_decl
 )
 
@@ -43,38 +45,36 @@ def generateCallCode(to_name, expression, emit, context):
     # optimized code, constant, with and without positional or keyword arguments
     # each, so there is lots of branches here.
 
+    called = expression.getCalled()
+    call_args = expression.getCallArgs()
+    call_kw = expression.getCallKw()
+
+    if called.isExpressionAttributeLookup() and \
+       called.getAttributeName() not in ("__dict__", "__class__") and \
+       _hasQuickPositionalArgs(call_args, call_kw):
+        generateMethodCallCode(
+            to_name    = to_name,
+            expression = expression,
+            emit       = emit,
+            context    = context
+        )
+
+        return
+
     called_name = generateChildExpressionCode(
-        expression = expression.getCalled(),
+        expression = called,
         emit       = emit,
         context    = context
     )
 
-    call_args = expression.getCallArgs()
-    call_kw = expression.getCallKw()
-
     if call_kw is None or \
        (call_kw.isExpressionConstantRef() and call_kw.getConstant() == {}):
         if call_args is None or call_args.isExpressionConstantRef():
-            if call_args is not None:
-                call_args_value = call_args.getConstant()
-            else:
-                call_args_value = ()
-
-            assert type(call_args_value) is tuple
-
-            call_arg_names = []
-
-            for call_arg_element in call_args_value:
-                call_arg_name = context.allocateTempName("call_arg_element")
-
-                getConstantAccess(
-                    to_name  = call_arg_name,
-                    constant = call_arg_element,
-                    emit     = emit,
-                    context  = context,
-                )
-
-                call_arg_names.append(call_arg_name)
+            call_arg_names = _generateQuickPositionalArgNames(
+                call_args = call_args,
+                emit      = emit,
+                context   = context
+            )
 
             context.setCurrentSourceCodeReference(
                 expression.getCompatibleSourceReference()
@@ -98,17 +98,11 @@ def generateCallCode(to_name, expression, emit, context):
                     context     = context
                 )
         elif call_args.isExpressionMakeTuple():
-            call_arg_names = []
-
-            for call_arg_element in call_args.getElements():
-                call_arg_name = generateChildExpressionCode(
-                    child_name = call_args.getChildName() + "_element",
-                    expression = call_arg_element,
-                    emit       = emit,
-                    context    = context,
-                )
-
-                call_arg_names.append(call_arg_name)
+            call_arg_names = _generateQuickPositionalArgNames(
+                call_args = call_args,
+                emit      = emit,
+                context   = context
+            )
 
             context.setCurrentSourceCodeReference(
                 expression.getCompatibleSourceReference()
@@ -188,6 +182,173 @@ def generateCallCode(to_name, expression, emit, context):
             )
 
 
+def _hasQuickPositionalArgs(call_args, call_kw):
+    if call_kw is not None and \
+       (not call_kw.isExpressionConstantRef() or call_kw.getConstant() != {}):
+        return False
+
+    return call_args is None or \
+           call_args.isExpressionConstantRef() or \
+           call_args.isExpressionMakeTuple()
+
+
+def _generateQuickPositionalArgNames(call_args, emit, context):
+    call_arg_names = []
+
+    if call_args is None or call_args.isExpressionConstantRef():
+        if call_args is not None:
+            call_args_value = call_args.getConstant()
+        else:
+            call_args_value = ()
+
+        assert type(call_args_value) is tuple
+
+        for call_arg_element in call_args_value:
+            call_arg_name = context.allocateTempName("call_arg_element")
+
+            getConstantAccess(
+                to_name  = call_arg_name,
+                constant = call_arg_element,
+                emit     = emit,
+                context  = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+    else:
+        for call_arg_element in call_args.getElements():
+            call_arg_name = generateChildExpressionCode(
+                child_name = call_args.getChildName() + "_element",
+                expression = call_arg_element,
+                emit       = emit,
+                context    = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+
+    return call_arg_names
+
+
+def generateMethodCallCode(to_name, expression, emit, context):
+    """ Code for calls of attribute lookups with positional arguments only.
+
+        The attribute is looked up with "LOOKUP_METHOD", which for functions
+        found in the type gives the function and the source object, so that
+        no bound method object needs to be created for the call.
+    """
+
+    called = expression.getCalled()
+    attribute_name = called.getAttributeName()
+
+    source_name = generateChildExpressionCode(
+        expression = called.getLookupSource(),
+        emit       = emit,
+        context    = context
+    )
+
+    # The source object is passed to the call as well, so it must stay alive
+    # while the arguments are evaluated.
+    call_args = expression.getCallArgs()
+
+    if not context.needsCleanup(source_name) and \
+       call_args is not None and \
+       call_args.isExpressionMakeTuple():
+        emit("Py_INCREF( %s );" % source_name)
+        context.addCleanupTempName(source_name)
+
+    called_name = context.allocateTempName("called_name")
+    method_self_name = context.allocateTempName("method_self")
+
+    cache_name = context.allocateAttributeCacheName()
+
+    context.addDeclaration(
+        cache_name,
+        "static struct Nuitka_AttributeCache %s;" % cache_name
+    )
+
+    old_source_ref = context.setCurrentSourceCodeReference(
+        called.getSourceReference()
+    )
+
+    emit(
+        "%s = LOOKUP_METHOD( %s, %s, &%s, &%s );" % (
+            called_name,
+            source_name,
+            getConstantCode(
+                context  = context,
+                constant = attribute_name
+            ),
+            method_self_name,
+            cache_name
+        )
+    )
+
+    getErrorExitCode(
+        check_name  = called_name,
+        needs_check = called.getLookupSource().mayRaiseExceptionAttributeLookup(
+            exception_type = BaseException,
+            attribute_name = attribute_name
+        ),
+        emit        = emit,
+        context     = context
+    )
+
+    context.addCleanupTempName(called_name)
+
+    context.setCurrentSourceCodeReference(old_source_ref)
+
+    call_arg_names = _generateQuickPositionalArgNames(
+        call_args = call_args,
+        emit      = emit,
+        context   = context
+    )
+
+    context.setCurrentSourceCodeReference(
+        expression.getCompatibleSourceReference()
+    )
+
+    emitLineNumberUpdateCode(context, emit)
+
+    if call_arg_names:
+        arg_size = len(call_arg_names)
+
+        quick_calls_used.add(arg_size)
+        quick_calls_used.add(arg_size + 1)
+        quick_method_calls_used.add(arg_size)
+
+        emit(
+            "%s = CALL_METHOD_WITH_ARGS%d( %s, %s, %s );" % (
+                to_name,
+                arg_size,
+                called_name,
+                method_self_name,
+                ", ".join(call_arg_names)
+            )
+        )
+    else:
+        emit(
+            "%s = CALL_METHOD_NO_ARGS( %s, %s );" % (
+                to_name,
+                called_name,
+                method_self_name
+            )
+        )
+
+    getReleaseCodes(
+        release_names = [called_name, source_name] + call_arg_names,
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name  = to_name,
+        needs_check = expression.mayRaiseException(BaseException),
+        emit        = emit,
+        context     = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def getCallCodeNoArgs(to_name, called_name, needs_check, emit, context):
     emitLineNumberUpdateCode(context, emit)
 
@@ -218,6 +379,8 @@ def getCallCodeNoArgs(to_name, called_name, needs_check, emit, context):
 # Outside helper code relies on some quick call to be present.
 quick_calls_used = set([1, 2, 3])
 
+quick_method_calls_used = set()
+
 def getCallCodePosArgsQuick(to_name, called_name, arg_names, needs_check,
                             emit, context):
 
@@ -350,9 +513,30 @@ def getCallsDecls():
             }
         )
 
-    return template_header_guard % {
-        "header_guard_name" : "__NUITKA_CALLS_H__",
-        "header_body"       : '\n'.join(result)
+    for quick_method_call_used in sorted(quick_method_calls_used):
+        args_decl = [
+            "PyObject *arg%d" % d
+            for d in range(quick_method_call_used)
+        ]
+        args_list = [
+            "arg%d" % d
+            for d in range(quick_method_call_used)
+        ]
+
+        result.append(
+            template_call_method_with_args_impl % {
+                "args_decl"       : ", ".join(args_decl),
+                "args_list"       : ", ".join(args_list),
+                "args_count"      : quick_method_call_used,
+                "self_args_count" : quick_method_call_used + 1
+            }
+        )
+
+    return template_helper_decl % {
+        "helper_decls" : template_header_guard % {
+            "header_guard_name" : "__NUITKA_CALLS_H__",
+            "header_body"       : '\n'.join(result)
+        }
     }
 
 
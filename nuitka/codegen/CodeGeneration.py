@@ -261,6 +261,58 @@ _generated_functions = {}
 
 
 
+def generateBuiltinIter1Code(to_name, expression, emit, context):
+    value = expression.getValue()
+
+    # Ranges are iterated directly, without creating the list or range object
+    # first, as that's what loops over them do.
+    if value.isExpressionBuiltinRange1():
+        capi = "MAKE_RANGE_ITERATOR"
+        arg_desc = (
+            ("range_arg", value.getLow()),
+            ("range2_high", None),
+            ("range3_step", None),
+        )
+    elif value.isExpressionBuiltinRange2():
+        capi = "MAKE_RANGE_ITERATOR"
+        arg_desc = (
+            ("range2_low", value.getLow()),
+            ("range2_high", value.getHigh()),
+            ("range3_step", None),
+        )
+    elif value.isExpressionBuiltinRange3():
+        capi = "MAKE_RANGE_ITERATOR"
+        arg_desc = (
+            ("range3_low", value.getLow()),
+            ("range3_high", value.getHigh()),
+            ("range3_step", value.getStep()),
+        )
+    elif value.isExpressionBuiltinXrange():
+        capi = "MAKE_XRANGE_ITERATOR"
+        arg_desc = (
+            ("xrange_low", value.getLow()),
+            ("xrange_high", value.getHigh()),
+            ("xrange_step", value.getStep()),
+        )
+    else:
+        capi = "MAKE_ITERATOR"
+        arg_desc = (
+            ("iter_arg", value),
+        )
+
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = capi,
+        arg_desc   = arg_desc,
+        may_raise  = expression.mayRaiseException(BaseException) or \
+                     value.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context,
+        none_null  = True
+    )
+
+
 def generateFunctionCreationCode(to_name, function_body, defaults, kw_defaults,
                                   annotations, defaults_first, emit, context):
     # This is about creating functions, which is detail ridden stuff,
@@ -936,14 +988,9 @@ def _generateExpressionCode(to_name, expression, emit, context, allow_none):
             )
 
     elif expression.isExpressionBuiltinIter1():
-        generateCAPIObjectCode(
+        generateBuiltinIter1Code(
             to_name    = to_name,
-            capi       = "MAKE_ITERATOR",
-            arg_desc   = (
-                ("iter_arg", expression.getValue()),
-            ),
-            may_raise  = expression.mayRaiseException(BaseException),
-            source_ref = expression.getCompatibleSourceReference(),
+            expression = expression,
             emit       = emit,
             context    = context
         )
@@ -1060,6 +1107,30 @@ def _generateExpressionCode(to_name, expression, emit, context, allow_none):
             emit     = emit,
             context  = context
         )
+    elif expression.isExpressionMakeListForIterator():
+        generateCAPIObjectCode(
+            to_name    = to_name,
+            capi       = "MAKE_LIST_FOR_ITERATOR",
+            arg_desc   = (
+                ("list_iterator", expression.getIterator()),
+            ),
+            may_raise  = False,
+            source_ref = expression.getCompatibleSourceReference(),
+            emit       = emit,
+            context    = context
+        )
+    elif expression.isExpressionMakeDictForIterator():
+        generateCAPIObjectCode(
+            to_name    = to_name,
+            capi       = "MAKE_DICT_FOR_ITERATOR",
+            arg_desc   = (
+                ("dict_iterator", expression.getIterator()),
+            ),
+            may_raise  = False,
+            source_ref = expression.getCompatibleSourceReference(),
+            emit       = emit,
+            context    = context
+        )
     elif expression.isExpressionMakeDict():
         assert expression.getPairs()
 
@@ -2460,10 +2531,11 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
     )
 
     getBuiltinLoopBreakNextCode(
-        to_name = tmp_name2,
-        value   = tmp_name,
-        emit    = emit,
-        context = context
+        to_name       = tmp_name2,
+        value         = tmp_name,
+        next_function = "ITERATOR_NEXT",
+        emit          = emit,
+        context       = context
     )
 
     getVariableAssignmentCode(
@@ -36,6 +36,11 @@ def getCodeObjectsDeclCode(context):
 
     return statements
 
+def getModuleFilenameObjectName(context):
+    # Module specific, so modules can share a translation unit.
+    return "module_filename_obj_%s" % context.getModuleCodeName()
+
+
 def getCodeObjectsInitCode(context):
     # There is a bit of details to this, code objects have many flags to deal
     # with, and we are making some optimizations as well as customization to
@@ -48,7 +53,7 @@ def getCodeObjectsInitCode(context):
     # Create the always identical, but dynamic filename first thing.
     if code_objects:
         context.markAsNeedsModuleFilenameObject()
-        filename_code = "module_filename_obj"
+        filename_code = getModuleFilenameObjectName(context)
 
     if context.needsModuleFilenameObject():
         module_filename = context.getOwner().getRunTimeFilename()
@@ -56,12 +61,13 @@ def getCodeObjectsInitCode(context):
         # We do not care about release of this object, as code object live
         # forever anyway.
         if Options.getFileReferenceMode() == "frozen":
-            template = "module_filename_obj = %s;"
+            template = "%s = %s;"
         else:
-            template = "module_filename_obj = MAKE_RELATIVE_PATH( %s );"
+            template = "%s = MAKE_RELATIVE_PATH( %s );"
 
         statements.append(
             template % (
+                getModuleFilenameObjectName(context),
                 context.getConstantCode(
                     constant = module_filename
                 )
@@ -57,6 +57,10 @@ class TempMixin:
 
         self.preserver_variable_counts = set()
 
+        # Shared error exits, code to label and in order of creation.
+        self.error_exit_labels = {}
+        self.error_exit_codes = []
+
     def formatTempName(self, base_name, number):
         if number is None:
             return "tmp_{name}".format(
@@ -163,6 +167,20 @@ class TempMixin:
             number = result
         )
 
+    def getErrorExitLabel(self, exit_code):
+        if exit_code not in self.error_exit_labels:
+            label = self.allocateLabel("error_exit")
+
+            self.error_exit_labels[exit_code] = label
+            self.error_exit_codes.append(
+                "%s:\n%s" % (label, exit_code)
+            )
+
+        return self.error_exit_labels[exit_code]
+
+    def getErrorExitCodes(self):
+        return self.error_exit_codes
+
     def needsExceptionVariables(self):
         return self.needs_exception_variables
 
@@ -304,6 +322,9 @@ class PythonChildContextBase(PythonContextBase):
     def addDeclaration(self, key, code):
         self.parent.addDeclaration(key, code)
 
+    def allocateAttributeCacheName(self):
+        return self.parent.allocateAttributeCacheName()
+
 
 
 def _getConstantDefaultPopulation():
@@ -407,11 +428,6 @@ def _getConstantDefaultPopulation():
             "__main__",
         )
 
-        # The "site" module is referenced in inspect patching.
-        result += (
-            "site",
-        )
-
     # Builtin original values
     if not Options.shallMakeModule():
         result += (
@@ -606,6 +622,12 @@ class PythonModuleContext(PythonContextBase, TempMixin, CodeObjectsMixin,
     def getDeclarations(self):
         return self.declaration_codes
 
+    def allocateAttributeCacheName(self):
+        return "cache_attribute_%s_%d" % (
+            self.code_name,
+            self.allocateTempNumber("attribute_cache")
+        )
+
     def getReturnValueName(self):
         return self.return_name
 
@@ -869,6 +891,9 @@ class PythonStatementCContext(PythonChildContextBase):
     def allocateLabel(self, label):
         return self.parent.allocateLabel(label)
 
+    def getErrorExitLabel(self, exit_code):
+        return self.parent.getErrorExitLabel(exit_code)
+
     def addCleanupTempName(self, tmp_name):
         assert tmp_name not in self.cleanup_names, tmp_name
 
@@ -55,6 +55,22 @@ def generateDictionaryCreationCode(to_name, pairs, emit, context):
         )
 
 
+    # With only distinct constant string keys, none of the keys needs to be
+    # looked up while inserting.
+    if python_version < 300:
+        keys = [
+            pair.getKey().getConstant()
+            for pair in
+            pairs
+            if pair.getKey().isExpressionConstantRef()
+            if type(pair.getKey().getConstant()) is str
+        ]
+
+        new_string_keys = len(keys) == len(pairs) and \
+                          len(set(keys)) == len(keys)
+    else:
+        new_string_keys = False
+
     # Strange as it is, CPython evaluates the key/value pairs strictly in order,
     # but for each pair, the value first.
     for pair in pairs:
@@ -68,7 +84,15 @@ def generateDictionaryCreationCode(to_name, pairs, emit, context):
             generateKeyCode(dict_key_name, pair)
             generateValueCode(dict_value_name, pair)
 
-        if pair.getKey().isKnownToBeHashable():
+        if new_string_keys:
+            emit(
+                "DICT_SET_ITEM_NEW_STRING( %s, %s, %s );" % (
+                    to_name,
+                    dict_key_name,
+                    dict_value_name
+                )
+            )
+        elif pair.getKey().isKnownToBeHashable():
             emit(
                 "PyDict_SetItem( %s, %s, %s );" % (
                     to_name,
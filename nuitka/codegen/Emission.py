@@ -30,9 +30,11 @@ class SourceCodeCollector:
     def __call__(self, code):
         self.emit(code)
 
-    def emit(self,code):
-        for line in code.split('\n'):
-            self.codes.append(line)
+    def emit(self, code):
+        if '\n' in code:
+            self.codes.extend(code.split('\n'))
+        else:
+            self.codes.append(code)
 
     def emitTo(self, emit):
         for code in self.codes:
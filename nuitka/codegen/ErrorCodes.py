@@ -36,7 +36,8 @@ from .Indentation import getCommentCode, indented
 from .LineNumberCodes import getErrorLineNumberUpdateCode
 from .templates.CodeTemplatesExceptions import (
     template_error_catch_exception,
-    template_error_catch_quick_exception,
+    template_error_exit_exception,
+    template_error_exit_quick_exception,
     template_error_format_string_exception
 )
 
@@ -68,39 +69,40 @@ def getErrorExitBoolCode(condition, emit, context,
 
     context.markAsNeedsExceptionVariables()
 
+    # The exit sequence is shared by all sites of the function that release
+    # the same temporaries towards the same target, only the line number is
+    # set at the site.
     if quick_exception:
-        emit(
-            indented(
-                template_error_catch_quick_exception % {
-                    "condition"        : condition,
-                    "exception_exit"   : context.getExceptionEscape(),
-                    "quick_exception"  : getExceptionIdentifier(quick_exception),
-                    "release_temps"    : indented(
-                        getErrorExitReleaseCode(context)
-                    ),
-                    "line_number_code" : indented(
-                        getErrorLineNumberUpdateCode(context)
-                    )
-                },
-                0
-            )
-        )
+        exit_code = template_error_exit_quick_exception % {
+            "exception_exit"  : context.getExceptionEscape(),
+            "quick_exception" : getExceptionIdentifier(quick_exception),
+            "release_temps"   : getErrorExitReleaseCode(context)
+        }
     else:
-        emit(
-            indented(
-                template_error_catch_exception % {
-                    "condition"        : condition,
-                    "exception_exit"   : context.getExceptionEscape(),
-                    "release_temps"    : indented(
-                        getErrorExitReleaseCode(context)
-                    ),
-                    "line_number_code" : indented(
-                        getErrorLineNumberUpdateCode(context)
-                    )
-                },
-                0
+        exit_code = template_error_exit_exception % {
+            "exception_exit" : context.getExceptionEscape(),
+            "release_temps"  : getErrorExitReleaseCode(context)
+        }
+
+    emit(
+        template_error_catch_exception % {
+            "condition"        : condition,
+            "error_exit"       : context.getErrorExitLabel(exit_code),
+            "line_number_code" : indented(
+                getErrorLineNumberUpdateCode(context)
             )
-        )
+        }
+    )
+
+
+def getErrorExitStubsCode(context):
+    """ Get the code of the shared error exits of a function or module.
+
+        To be placed after the exit code, where nothing falls through to it.
+    """
+    return indented(
+        '\n'.join(context.getErrorExitCodes())
+    )
 
 
 def getErrorExitCode(check_name, emit, context, quick_exception = None, needs_check = True):
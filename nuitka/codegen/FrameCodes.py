@@ -37,6 +37,7 @@ from .templates.CodeTemplatesFrames import (
     template_frame_guard_generator,
     template_frame_guard_generator_exception_handler,
     template_frame_guard_generator_return_handler,
+    template_frame_guard_inline_exception_exit,
     template_frame_guard_once
 )
 
@@ -56,7 +57,13 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
     # Allow stacking of frame handles.
     old_frame_handle = context.getFrameHandle()
 
-    if guard_mode != "pass_through":
+    if guard_mode == "inline":
+        context.setFrameHandle(context.allocateLabel("frame_inline"))
+
+        context.setExceptionEscape(
+            context.allocateLabel("frame_exception_exit")
+        )
+    elif guard_mode != "pass_through":
         if provider.isExpressionFunctionBody():
             if provider.isGenerator():
                 context.setFrameHandle("generator->m_frame")
@@ -128,6 +135,28 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
         # This case does not care about "needs_preserve", as for that kind
         # of frame, it is an empty code stub anyway.
         local_emit.emitTo(emit)
+    elif guard_mode == "inline":
+        # Exceptions leaving the in-lined frame are to be attributed to the
+        # line, where the outline it belongs to is used.
+        outline_body = statement_sequence.getParentReturnConsumer()
+
+        getFrameGuardHeavyCode(
+            frame_identifier        = context.getFrameHandle(),
+            code_identifier         = statement_sequence.getCodeObjectHandle(
+                context
+            ),
+            parent_exception_exit   = parent_exception_exit,
+            parent_return_exit      = parent_return_exit,
+            frame_exception_exit    = frame_exception_exit,
+            frame_return_exit       = frame_return_exit,
+            codes                   = local_emit.codes,
+            needs_preserve          = needs_preserve,
+            provider                = None,
+            emit                    = emit,
+            context                 = context,
+            parent_exception_lineno = outline_body.getSourceReference().\
+                                        getLineNumber()
+        )
     elif guard_mode == "full":
         assert provider.isExpressionFunctionBody()
 
@@ -180,7 +209,8 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
 def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
                            needs_preserve, parent_exception_exit,
                            parent_return_exit, frame_exception_exit,
-                           frame_return_exit, provider, emit, context):
+                           frame_return_exit, provider, emit, context,
+                           parent_exception_lineno = None):
     # We really need this many parameters here. pylint: disable=R0913
 
     no_exception_exit = context.allocateLabel("frame_no_exception")
@@ -223,6 +253,14 @@ def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
             context  = context
         )
 
+        # For in-lined frames, the frame of the parent reports its own line.
+        if parent_exception_lineno is not None:
+            lineno_exception_exit = context.allocateLabel(
+                "frame_lineno_exception_exit"
+            )
+        else:
+            lineno_exception_exit = parent_exception_exit
+
         emit(
             template_frame_guard_full_exception_handler % {
                 "frame_identifier"      : frame_identifier,
@@ -236,12 +274,21 @@ def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
                                               context     = context,
                                               lineno_name = "exception_lineno"
                                           ),
-                "parent_exception_exit" : parent_exception_exit,
+                "parent_exception_exit" : lineno_exception_exit,
                 "frame_exception_exit"  : frame_exception_exit,
                 "needs_preserve"        : 1 if needs_preserve else 0,
             }
         )
 
+        if parent_exception_lineno is not None:
+            emit(
+                template_frame_guard_inline_exception_exit % {
+                    "lineno_exception_exit" : lineno_exception_exit,
+                    "line_number"           : parent_exception_lineno,
+                    "parent_exception_exit" : parent_exception_exit
+                }
+            )
+
     emit("%s:;\n" % no_exception_exit)
 
 
@@ -353,6 +400,19 @@ def getFrameGuardLightCode(code_identifier, codes, parent_exception_exit,
 def getFrameLocalsUpdateCode(provider, context):
     locals_codes = Emission.SourceCodeCollector()
 
+    if provider is None:
+        # In-lined frames do not expose their locals.
+        frame_locals_name = context.allocateTempName(
+            "frame_locals",
+            unique = True
+        )
+
+        locals_codes.emit(
+            "%s = PyDict_New();" % frame_locals_name
+        )
+
+        return frame_locals_name, locals_codes.codes
+
     context.setCurrentSourceCodeReference(
         provider.getSourceReference()
     )
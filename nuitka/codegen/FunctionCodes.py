@@ -26,6 +26,7 @@ from .Contexts import PythonFunctionCoroutineContext
 from .Emission import SourceCodeCollector
 from .ErrorCodes import (
     getErrorExitCode,
+    getErrorExitStubsCode,
     getErrorVariableDeclarations,
     getExceptionKeeperVariableNames,
     getExceptionPreserverVariableNames,
@@ -509,6 +510,9 @@ def getFunctionCode(context, function_name, function_identifier, parameters,
             }
         )
 
+    # All the exits above return, so the shared error exits go after them.
+    function_exit += "\n" + getErrorExitStubsCode(context)
+
     if context.isForDirectCall():
         parameter_objects_decl += getFunctionDirectClosureArgs(closure_variables)
 
@@ -628,6 +632,9 @@ def getGeneratorFunctionCode(context, function_name, function_qualname,
     if needs_generator_return:
         generator_exit += template_generator_return_exit % {}
 
+    # All the exits above return, so the shared error exits go after them.
+    generator_exit += "\n" + getErrorExitStubsCode(context)
+
     result = template_genfunc_yielder_template % {
         "function_identifier" : function_identifier,
         "function_body"       : indented(function_codes),
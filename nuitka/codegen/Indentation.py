@@ -22,23 +22,24 @@ Language independent, the amount of the spaces is not configurable, as it needs
 to be the same as in templates.
 """
 
-def _indentedCode(codes, count):
-    return '\n'.join(
-        ' ' * count + line
-          if (line and not line.startswith('#')) else
-        line for line in codes
-    )
+import re
+
+# Start of every line that is neither empty nor a pre-processor directive,
+# these are the ones that receive the indentation.
+_indent_pattern = re.compile(r"^(?!$|#)", re.M)
 
 
 def indented(codes, level = 1, vert_block = False):
-    if type(codes) is str:
-        codes = codes.split('\n')
+    # Codes come in as lines or as a block of text, and the result of nested
+    # indentations is indented again by the outer templates, so this is done
+    # in one pass over the text, rather than line by line.
+    if type(codes) is not str:
+        codes = '\n'.join(codes)
 
-    if vert_block and codes != [""]:
-        codes.insert(0, "")
-        codes.append("")
+    if vert_block and codes != "":
+        codes = '\n' + codes + '\n'
 
-    return _indentedCode(codes, level * 4)
+    return _indent_pattern.sub(' ' * (level * 4), codes)
 
 
 def getCommentCode(comment, emit):
@@ -59,11 +59,12 @@ def getBuiltinNext1Code(to_name, value, emit, context):
     context.addCleanupTempName(to_name)
 
 
-def getBuiltinLoopBreakNextCode(to_name, value, emit, context):
+def getBuiltinLoopBreakNextCode(to_name, value, next_function, emit, context):
     emit(
-        "%s = %s;" % (
+        "%s = %s( %s );" % (
             to_name,
-            "ITERATOR_NEXT( %s )" % value,
+            next_function,
+            value,
         )
     )
 
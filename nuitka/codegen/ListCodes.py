@@ -77,7 +77,7 @@ def generateListOperationAppendCode(to_name, expression, emit, context):
 
     emit("assert( PyList_Check( %s ) );" % list_arg_name)
     emit(
-        "%s = PyList_Append( %s, %s );" % (
+        "%s = LIST_APPEND_ITEM( %s, %s );" % (
             res_name,
             list_arg_name,
             value_arg_name
@@ -21,13 +21,18 @@
 
 from nuitka import Options
 
-from .CodeObjectCodes import getCodeObjectsDeclCode, getCodeObjectsInitCode
+from .CodeObjectCodes import (
+    getCodeObjectsDeclCode,
+    getCodeObjectsInitCode,
+    getModuleFilenameObjectName
+)
 from .ConstantCodes import (
     allocateNestedConstants,
     getConstantCode,
     getConstantInitCodes
 )
 from .ErrorCodes import (
+    getErrorExitStubsCode,
     getErrorVariableDeclarations,
     getExceptionKeeperVariableNames,
     getExceptionPreserverVariableNames
@@ -90,6 +95,9 @@ def getModuleValues(context, module_name, module_identifier, codes,
     else:
         module_exit = template_module_noexception_exit
 
+    # The module code returns before, so the shared error exits go here.
+    module_exit = getErrorExitStubsCode(context) + "\n" + module_exit
+
     module_body_template_values = {
         "module_name"              : module_name,
         "module_name_obj"          : getConstantCode(
@@ -134,7 +142,9 @@ def getModuleCode(module_context, template_values):
     decls, inits, checks = getConstantInitCodes(module_context)
 
     if module_context.needsModuleFilenameObject():
-        decls.append("static PyObject *module_filename_obj;")
+        decls.append(
+            "static PyObject *%s;" % getModuleFilenameObjectName(module_context)
+        )
 
     template_values["constant_decl_codes"] = indented(
         decls,
@@ -159,8 +169,9 @@ def generateModuleFileAttributeCode(to_name, expression, emit, context):
     # the expression registry, pylint: disable=W0613
 
     emit(
-        "%s = module_filename_obj;" % (
+        "%s = %s;" % (
             to_name,
+            getModuleFilenameObjectName(context)
         )
     )
 
@@ -22,7 +22,7 @@ finally block gets duplicated into handlers. So this is a common low level
 structure used, where exception handling and everything is made explicit.
 """
 
-from nuitka import Options
+from nuitka import Options, VariableRegistry
 
 from .ErrorCodes import getMustNotGetHereCode
 from .ExceptionCodes import getExceptionUnpublishedReleaseCode
@@ -238,6 +238,43 @@ exception_lineno = -1;
         getLabelCode(post_label, emit)
 
 
+def _getLoopIteratorNextFunction(iterator_ref):
+    """ Select the C function to advance the iterator of a loop.
+
+    For loop iterators, created only once from a value, we can check for the
+    common iterator types, and for ranges, we know it's one of ours.
+    """
+    if not iterator_ref.isExpressionTempVariableRef():
+        return "ITERATOR_NEXT"
+
+    global_trace = VariableRegistry.getGlobalVariableTrace(
+        iterator_ref.getVariable()
+    )
+
+    if global_trace is None:
+        return "ITERATOR_NEXT"
+
+    assign_traces = global_trace.getAssignTraces()
+
+    if len(assign_traces) != 1:
+        return "ITERATOR_NEXT"
+
+    assign_source = assign_traces[0].getAssignNode().getAssignSource()
+
+    if not assign_source.isExpressionBuiltinIter1():
+        return "ITERATOR_NEXT"
+
+    value = assign_source.getValue()
+
+    if value.isExpressionBuiltinRange1() or \
+       value.isExpressionBuiltinRange2() or \
+       value.isExpressionBuiltinRange3() or \
+       value.isExpressionBuiltinXrange():
+        return "RANGE_ITERATOR_NEXT"
+    else:
+        return "LOOP_ITERATOR_NEXT"
+
+
 def generateTryNextExceptStopIterationCode(statement, emit, context):
     # This has many branches which mean this optimized code generation is not
     # applicable, we return each time. pylint: disable=R0911,R0912
@@ -318,10 +355,13 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
     )
 
     getBuiltinLoopBreakNextCode(
-        to_name = tmp_name2,
-        value   = tmp_name,
-        emit    = emit,
-        context = context
+        to_name       = tmp_name2,
+        value         = tmp_name,
+        next_function = _getLoopIteratorNextFunction(
+            iterator_ref = assign_source.getValue()
+        ),
+        emit          = emit,
+        context       = context
     )
 
     getVariableAssignmentCode(
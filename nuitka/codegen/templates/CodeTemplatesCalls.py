@@ -307,5 +307,18 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d( PyObject *called, %(args_decl)s
 }
 """
 
+template_call_method_with_args_impl = """\
+NUITKA_MAY_BE_UNUSED static PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *called, PyObject *method_self, %(args_decl)s )
+{
+    if ( method_self == NULL )
+    {
+        return CALL_FUNCTION_WITH_ARGS%(args_count)d( called, %(args_list)s );
+    }
+    else
+    {
+        return CALL_FUNCTION_WITH_ARGS%(self_args_count)d( called, method_self, %(args_list)s );
+    }
+}"""
+
 from . import TemplateDebugWrapper # isort:skip
 TemplateDebugWrapper.checkDebug(globals())
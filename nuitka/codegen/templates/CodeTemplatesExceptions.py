@@ -31,37 +31,40 @@ else if ( %(keeper_lineno)s != -1 )
 }
 """
 
-template_error_catch_quick_exception = """\
-if ( %(condition)s )
+template_error_catch_exception = """\
+if ( unlikely( %(condition)s ) )
 {
-    if ( !ERROR_OCCURRED() )
-    {
-        exception_type = %(quick_exception)s;
-        Py_INCREF( exception_type );
-        exception_value = NULL;
-        exception_tb = NULL;
-    }
-    else
-    {
-        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
-    }
-%(release_temps)s
-
 %(line_number_code)s
-    goto %(exception_exit)s;
+    goto %(error_exit)s;
 }"""
 
-template_error_catch_exception = """\
-if ( %(condition)s )
+# The shared exit stubs, one per distinct release and target combination of a
+# function, the label is provided by the context. These are emitted after the
+# function's own exit code, out of the way of the hot path, and the line number
+# is set at the site that jumps to them.
+template_error_exit_quick_exception = """\
+if ( !ERROR_OCCURRED() )
+{
+    exception_type = %(quick_exception)s;
+    Py_INCREF( exception_type );
+    exception_value = NULL;
+    exception_tb = NULL;
+}
+else
 {
-    assert( ERROR_OCCURRED() );
-
     FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+}
 %(release_temps)s
+goto %(exception_exit)s;
+"""
 
-%(line_number_code)s
-    goto %(exception_exit)s;
-}"""
+template_error_exit_exception = """\
+assert( ERROR_OCCURRED() );
+
+FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+%(release_temps)s
+goto %(exception_exit)s;
+"""
 
 template_error_format_string_exception = """\
 if ( %(condition)s )
@@ -113,6 +113,14 @@ Py_DECREF( %(frame_identifier)s );
 goto %(parent_exception_exit)s;
 """
 
+# Frame in-lined into another one, exceptions leaving it, have to report the
+# line of the frame it was in-lined into.
+template_frame_guard_inline_exception_exit = """\
+%(lineno_exception_exit)s:;
+exception_lineno = %(line_number)d;
+goto %(parent_exception_exit)s;
+"""
+
 # Frame for a module. TODO: Use it for functions called only once.
 # TODO: The once guard need not take a reference count in its frame class.
 template_frame_guard_once = """\
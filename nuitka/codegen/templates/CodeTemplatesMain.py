@@ -195,6 +195,7 @@ int main( int argc, char **argv )
 
 #if PYTHON_VERSION < 300
     _initSlotCompare();
+    _initIteratorTypes();
 #endif
 #if PYTHON_VERSION >= 270
     _initSlotIternext();
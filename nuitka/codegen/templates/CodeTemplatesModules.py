@@ -41,8 +41,6 @@ template_global_copyright = """\
 // limitations under the License.
 """
 template_module_body_template = """
-#include "nuitka/prelude.hpp"
-
 #include "__helpers.hpp"
 
 // The _module_%(module_identifier)s is a Python object pointer of module type.
@@ -57,20 +55,20 @@ PyDictObject *moduledict_%(module_identifier)s;
 // The module constants used
 %(constant_decl_codes)s
 
-static bool constants_created = false;
+static bool constants_created_%(module_identifier)s = false;
 
-static void createModuleConstants( void )
+static void createModuleConstants_%(module_identifier)s( void )
 {
 %(constant_init_codes)s
 
-    constants_created = true;
+    constants_created_%(module_identifier)s = true;
 }
 
 #ifndef __NUITKA_NO_ASSERT__
 void checkModuleConstants_%(module_identifier)s( void )
 {
     // The module may not have been used at all.
-    if (constants_created == false) return;
+    if (constants_created_%(module_identifier)s == false) return;
 
 %(constant_check_codes)s
 }
@@ -79,7 +77,7 @@ void checkModuleConstants_%(module_identifier)s( void )
 // The module code objects.
 %(module_code_objects_decl)s
 
-static void createModuleCodeObjects(void)
+static void createModuleCodeObjects_%(module_identifier)s(void)
 {
 %(module_code_objects_init)s
 }
@@ -147,6 +145,7 @@ MOD_INIT_DECL( %(module_identifier)s )
 
 #if PYTHON_VERSION < 300
     _initSlotCompare();
+    _initIteratorTypes();
 #endif
 #if PYTHON_VERSION >= 270
     _initSlotIternext();
@@ -162,8 +161,8 @@ MOD_INIT_DECL( %(module_identifier)s )
     setupMetaPathBasedLoader();
 #endif
 
-    createModuleConstants();
-    createModuleCodeObjects();
+    createModuleConstants_%(module_identifier)s();
+    createModuleCodeObjects_%(module_identifier)s();
 
     // puts( "in init%(module_identifier)s" );
 
@@ -251,11 +250,21 @@ template_module_exception_exit = """\
 template_module_noexception_exit = """\
 }"""
 
+template_helper_decl = """\
+// This file contains helper declarations that are automatically created from
+// templates. It is included first by all generated code, and includes the
+// prelude, so it can serve as a precompiled header.
+
+#include "nuitka/prelude.hpp"
+
+%(helper_decls)s
+"""
+
 template_helper_impl_decl = """\
 // This file contains helper functions that are automatically created from
 // templates.
 
-#include "nuitka/prelude.hpp"
+#include "__helpers.hpp"
 
 extern PyObject *callPythonFunction( PyObject *func, PyObject **args, int count );
 
@@ -303,10 +303,6 @@ def detectLateImports():
             pickle = "pickle" if Utils.python_version >= 300 else "cPickle"
         )
 
-    # For Python3 we patch inspect without knowing if it is used.
-    if Utils.python_version >= 300:
-        command += "import inspect;"
-
     if command:
         result = _detectImports(command, True)
 
@@ -176,7 +176,7 @@ class NodeTreeModel(QtCore.QAbstractItemModel):
 
     def getItemFromSourceRef(self, source_ref):
         def check(item):
-            if item.node.getSourceReference() == source_ref:
+            if item.node.getSourceReference() is source_ref:
                 return item
 
             for child in item._children():
@@ -76,7 +76,7 @@ def isPackageDir(dirname):
     return Utils.isDir(dirname) and \
            (
                Utils.python_version >= 330 or
-               Utils.isFile(Utils.joinpath(dirname, "__init__.py")) or
+               "__init__.py" in _getDirectoryListing(dirname) or
                isPreloadedPackagePath(dirname)
            )
 
@@ -171,6 +171,10 @@ def normalizePackageName(module_name):
     return module_name
 
 
+# Successful results of "findModule", the key is module name, parent package
+# and level, which is all that the result depends on.
+module_finding_cache = {}
+
 def findModule(importing, module_name, parent_package, level, warn):
     """ Find a module with given package name as parent.
 
@@ -181,8 +185,6 @@ def findModule(importing, module_name, parent_package, level, warn):
         and filename of it, which can be a directory.
     """
 
-    # We have many branches here, because there are a lot of cases to try.
-    # pylint: disable=R0912
     if _debug_module_finding:
         print(
             "findModule: Enter to search %r in package %r level %s." % (
@@ -192,6 +194,34 @@ def findModule(importing, module_name, parent_package, level, warn):
             )
         )
 
+    key = module_name, parent_package, level
+
+    if key in module_finding_cache:
+        if _debug_module_finding:
+            print("findModule: Cached result (see previous call).")
+
+        return module_finding_cache[key]
+
+    result = _findModule1(
+        importing      = importing,
+        module_name    = module_name,
+        parent_package = parent_package,
+        level          = level,
+        warn           = warn
+    )
+
+    # Not found modules are rare, and need to give warnings with the
+    # importing module, so these are not cached.
+    if result[2] != "not-found":
+        module_finding_cache[key] = result
+
+    return result
+
+
+def _findModule1(importing, module_name, parent_package, level, warn):
+    # We have many branches here, because there are a lot of cases to try.
+    # pylint: disable=R0912
+
     # Do not allow star imports to get here. We just won't find modules with
     # that name, but it would be wasteful.
     assert module_name != '*'
@@ -282,8 +312,25 @@ def findModule(importing, module_name, parent_package, level, warn):
     return None, None, "not-found"
 
 
-# Some platforms are case insensitive.
-case_sensitive = not sys.platform.startswith(("win", "cygwin", "darwin"))
+# Directory contents, by directory name. Listing a directory once is much
+# cheaper than checking every import candidate in every search path entry.
+directory_listings = {}
+
+def _getDirectoryListing(dirname):
+    """ Names in a directory, empty if it is not a directory.
+
+        The result is cached, the directories are not expected to change
+        during compilation. Names are with their exact case, even on case
+        insensitive platforms.
+    """
+    if dirname not in directory_listings:
+        try:
+            directory_listings[dirname] = frozenset(os.listdir(dirname))
+        except OSError:
+            directory_listings[dirname] = frozenset()
+
+    return directory_listings[dirname]
+
 
 def _findModuleInPath2(module_name, search_path):
     """ This is out own module finding low level implementation.
@@ -308,17 +355,21 @@ def _findModuleInPath2(module_name, search_path):
             continue
         considered.add(Utils.normcase(entry))
 
+        # Only exact case matches matter, which the listing gives us on case
+        # insensitive systems too.
+        entry_listing = _getDirectoryListing(entry)
+
         package_directory = os.path.join(entry, module_name)
 
         # First, check for a package with an init file, that would be the
         # first choice.
-        if Utils.isDir(package_directory):
+        if module_name in entry_listing and Utils.isDir(package_directory):
+            package_listing = _getDirectoryListing(package_directory)
+
             for suffix in (".py", ".pyc"):
                 package_file_name = "__init__" + suffix
 
-                file_path = os.path.join(package_directory, package_file_name)
-
-                if Utils.isFile(file_path):
+                if package_file_name in package_listing:
                     candidates.add(
                         (entry, 1, package_directory)
                     )
@@ -331,6 +382,9 @@ def _findModuleInPath2(module_name, search_path):
 
         # Then, check out suffixes of all kinds.
         for suffix, _mode, _type in imp.get_suffixes():
+            if module_name + suffix not in entry_listing:
+                continue
+
             file_path = Utils.joinpath(entry, module_name + suffix)
             if Utils.isFile(file_path):
                 candidates.add(
@@ -352,19 +406,7 @@ def _findModuleInPath2(module_name, search_path):
             if candidate[1] == min_prio
         ]
 
-        # On case sensitive systems, no resolution needed.
-        if case_sensitive:
-            return candidates[0][2]
-        else:
-            for candidate in candidates:
-                dir_listing = os.listdir(candidate[0])
-
-                for filename in dir_listing:
-                    if Utils.joinpath(candidate[0], filename) == candidate[2]:
-                        return candidate[2]
-
-            # Only exact case matches matter, all candidates were ignored,
-            # lets just fall through to raising the import error.
+        return candidates[0][2]
 
     # Nothing found.
     raise ImportError
@@ -380,6 +422,9 @@ def getPackageSearchPath(package_name):
 
         result = []
         for element in getPackageSearchPath(parent_package_name):
+            if package_name not in _getDirectoryListing(element):
+                continue
+
             package_dir = Utils.joinpath(
                 element,
                 package_name
@@ -252,8 +252,7 @@ Side effects of assignments promoted to statements.""",
                             # Something might be possible still.
 
                             pass
-                    elif Options.isExperimental() and \
-                        source.isExpressionFunctionCreation() and \
+                    elif source.isExpressionFunctionCreation() and \
                         not source.getFunctionRef().getFunctionBody().isGenerator() and \
                         not source.getFunctionRef().getFunctionBody().isExpressionClassBody() and \
                         not source.getDefaults() and  \
@@ -270,7 +269,12 @@ Side effects of assignments promoted to statements.""",
                             # This limitation may fall later.
                             if not variable.isSharedLogically():
 
-                                if last_trace.getDefiniteUsages() <= 1 and \
+                                # Dropping functions never used is safe, but
+                                # forward propagating them to their single
+                                # use is still experimental.
+                                if (last_trace.getDefiniteUsages() == 0 or \
+                                    (last_trace.getDefiniteUsages() == 1 and \
+                                     Options.isExperimental())) and \
                                    not last_trace.hasPotentialUsages() and \
                                    not last_trace.hasNameUsages():
 
@@ -262,6 +262,11 @@ class ExpressionBuiltinGetattr(ExpressionChildrenHavingBase):
 
     named_children = ("source", "attribute", "default")
 
+    clone_arg_names = {
+        "source"    : "object_arg",
+        "attribute" : "name"
+    }
+
     @calledWithBuiltinArgumentNamesDecorator
     def __init__(self, object_arg, name, default, source_ref):
         ExpressionChildrenHavingBase.__init__(
@@ -329,6 +334,11 @@ class ExpressionBuiltinSetattr(ExpressionChildrenHavingBase):
 
     named_children = ("source", "attribute", "value")
 
+    clone_arg_names = {
+        "source"    : "object_arg",
+        "attribute" : "name"
+    }
+
     @calledWithBuiltinArgumentNamesDecorator
     def __init__(self, object_arg, name, value, source_ref):
         ExpressionChildrenHavingBase.__init__(
@@ -357,6 +367,11 @@ class ExpressionBuiltinHasattr(ExpressionChildrenHavingBase):
 
     named_children = ("source", "attribute")
 
+    clone_arg_names = {
+        "source"    : "object_arg",
+        "attribute" : "name"
+    }
+
     @calledWithBuiltinArgumentNamesDecorator
     def __init__(self, object_arg, name, source_ref):
         ExpressionChildrenHavingBase.__init__(
@@ -55,6 +55,10 @@ class ExpressionBuiltinType3(ExpressionChildrenHavingBase):
 
     named_children = ("type_name", "bases", "dict")
 
+    clone_arg_names = {
+        "dict" : "type_dict"
+    }
+
     def __init__(self, type_name, bases, type_dict, source_ref):
         ExpressionChildrenHavingBase.__init__(
             self,
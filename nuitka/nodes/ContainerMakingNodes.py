@@ -236,3 +236,44 @@ class ExpressionMakeSet(ExpressionMakeSequenceBase):
 
         return iter_node, "new_expression", """\
 Iteration over set reduced to tuple."""
+
+
+class ExpressionMakeContainerForIteratorBase(ExpressionChildrenHavingBase):
+    """ Empty container with room for what an iterator is going to give.
+
+        Used for contractions that take all values of their iterator, where
+        the container can be created at the size the iterator reports, for
+        those iterators where that is known without running any code.
+    """
+
+    named_children = (
+        "iterator",
+    )
+
+    def __init__(self, iterator, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "iterator" : iterator,
+            },
+            source_ref = source_ref
+        )
+
+    getIterator = ExpressionChildrenHavingBase.childGetter("iterator")
+
+    def computeExpression(self, constraint_collection):
+        return self, None, None
+
+    def mayHaveSideEffects(self):
+        return False
+
+    def mayRaiseException(self, exception_type):
+        return False
+
+
+class ExpressionMakeListForIterator(ExpressionMakeContainerForIteratorBase):
+    kind = "EXPRESSION_MAKE_LIST_FOR_ITERATOR"
+
+
+class ExpressionMakeDictForIterator(ExpressionMakeContainerForIteratorBase):
+    kind = "EXPRESSION_MAKE_DICT_FOR_ITERATOR"
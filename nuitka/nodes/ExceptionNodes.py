@@ -19,6 +19,8 @@
 
 """
 
+from nuitka.PythonVersions import python_version
+
 from .NodeBases import (
     ExpressionChildrenHavingBase,
     ExpressionMixin,
@@ -161,7 +163,29 @@ Explicit raise already raises implicitly building exception cause."""
         return self, None, None
 
     def needsFrame(self):
-        return not self.isStatementReraiseException()
+        if not self.isStatementReraiseException():
+            return True
+
+        # For Python2, a re-raise outside of exception handlers raises the
+        # exception published last, which the frame keeps only until it ends.
+        if python_version < 300:
+            return not self._isInExceptHandler()
+
+        return False
+
+    def _isInExceptHandler(self):
+        node = self
+
+        while not node.isParentVariableProvider():
+            parent = node.getParent()
+
+            if parent.isStatementTry() and \
+               node is parent.getBlockExceptHandler():
+                return True
+
+            node = parent
+
+        return False
 
 
 class StatementRaiseExceptionImplicit(StatementRaiseException):
@@ -41,6 +41,12 @@ class ExpressionBuiltinEval(ExpressionChildrenHavingBase):
         "locals"
     )
 
+    clone_arg_names = {
+        "source"  : "source_code",
+        "globals" : "globals_arg",
+        "locals"  : "locals_arg"
+    }
+
     def __init__(self, source_code, globals_arg, locals_arg, source_ref):
         ExpressionChildrenHavingBase.__init__(
             self,
@@ -144,6 +150,12 @@ class StatementExec(StatementChildrenHavingBase):
         "locals"
     )
 
+    clone_arg_names = {
+        "source"  : "source_code",
+        "globals" : "globals_arg",
+        "locals"  : "locals_arg"
+    }
+
     def __init__(self, source_code, globals_arg, locals_arg, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
@@ -309,6 +321,10 @@ class ExpressionBuiltinCompile(ExpressionChildrenHavingBase):
         "optimize"
     )
 
+    clone_arg_names = {
+        "source" : "source_code"
+    }
+
     def __init__(self, source_code, filename, mode, flags, dont_inherit,
                  optimize, source_ref):
         ExpressionChildrenHavingBase.__init__(
@@ -59,7 +59,8 @@ class StatementsFrame(StatementsSequence):
     }
 
     def __init__(self, statements, guard_mode, code_name, var_names, arg_count,
-                 kw_only_count, has_starlist, has_stardict, source_ref):
+                 kw_only_count, has_starlist, has_stardict, source_ref,
+                 code_provider = None):
         StatementsSequence.__init__(
             self,
             statements = statements,
@@ -77,6 +78,9 @@ class StatementsFrame(StatementsSequence):
         self.has_starlist = has_starlist
         self.has_stardict = has_stardict
 
+        # For in-lined frames, the function body the code object belongs to.
+        self.code_provider = code_provider
+
         self.needs_frame_exception_preserve = False
 
     def getDetails(self):
@@ -90,6 +94,9 @@ class StatementsFrame(StatementsSequence):
             "has_stardict" : self.has_stardict,
         }
 
+        if self.code_provider is not None:
+            result["code_provider"] = self.code_provider
+
         if python_version >= 300:
             result["kw_only_count"] = self.kw_only_count
 
@@ -102,9 +109,9 @@ class StatementsFrame(StatementsSequence):
 
     def needsExceptionFramePreservation(self):
         if python_version < 300:
-            preserving = ("full", "once")
+            preserving = ("full", "once", "inline")
         else:
-            preserving = ("full", "once", "generator")
+            preserving = ("full", "once", "generator", "inline")
 
         return self.guard_mode in preserving
 
@@ -140,6 +147,15 @@ class StatementsFrame(StatementsSequence):
     def getArgumentCount(self):
         return self.arg_count
 
+    def markAsInlined(self, code_provider):
+        """ For use when the frame's function is in-lined into another one.
+
+            The frame then is entered as part of the code it is in-lined into,
+            but still uses the code object of the function it came from.
+        """
+        self.guard_mode = "inline"
+        self.code_provider = code_provider
+
     def markAsFrameExceptionPreserving(self):
         self.needs_frame_exception_preserve = True
 
@@ -147,6 +163,9 @@ class StatementsFrame(StatementsSequence):
         return self.needs_frame_exception_preserve
 
     def getCodeObjectHandle(self, context):
+        if self.code_provider is not None:
+            return self._getInlinedCodeObjectHandle(context)
+
         provider = self.getParentVariableProvider()
 
         # TODO: Why do this accessing a node, do this outside.
@@ -173,6 +192,27 @@ class StatementsFrame(StatementsSequence):
                               asFlags()
         )
 
+    def _getInlinedCodeObjectHandle(self, context):
+        # Same code object as the function itself would be using.
+        function_body = self.code_provider
+        parameters = function_body.getParameters()
+        source_ref = function_body.getSourceReference()
+
+        return context.getCodeObjectHandle(
+            filename      = self.getParentModule().getRunTimeFilename(),
+            var_names     = parameters.getCoArgNames(),
+            arg_count     = parameters.getArgumentCount(),
+            kw_only_count = parameters.getKwOnlyParameterCount(),
+            line_number   = source_ref.getLineNumber(),
+            code_name     = function_body.getFunctionName(),
+            is_generator  = function_body.isGenerator(),
+            is_optimized  = not function_body.hasLocalsDict(),
+            has_starlist  = parameters.getStarListArgumentName() is not None,
+            has_stardict  = parameters.getStarDictArgumentName() is not None,
+            has_closure   = function_body.getClosureVariables() != (),
+            future_flags  = source_ref.getFutureSpec().asFlags()
+        )
+
     def computeStatementsSequence(self, constraint_collection):
         # The extraction of parts of the frame that can be moved before or after
         # the frame scope, takes it toll to complexity, pylint: disable=R0912
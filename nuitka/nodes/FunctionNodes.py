@@ -256,6 +256,9 @@ class ExpressionFunctionBody(ExpressionFunctionBodyBase,
 
         return None
 
+    def isGeneratorExpression(self):
+        return self.is_genexpr
+
     def getFunctionName(self):
         if self.is_lambda:
             return "<lambda>"
@@ -854,10 +857,16 @@ class ExpressionFunctionRef(NodeBase, ExpressionMixin):
         # Make sure the owning module is added to the used set. This is most
         # important for helper functions, or modules, which otherwise have
         # become unused.
-        from nuitka.ModuleRegistry import addUsedModule
-        addUsedModule(owning_module)
+        from nuitka.ModuleRegistry import addUsedModule, getCurrentModule
+        addUsedModule(
+            module       = owning_module,
+            using_module = self.getParentModule()
+        )
 
-        owning_module.addUsedFunction(function_body)
+        owning_module.addUsedFunction(
+            function_body = function_body,
+            using_module  = getCurrentModule()
+        )
 
         from nuitka.optimizations.TraceCollections import \
             ConstraintCollectionFunction
@@ -1006,10 +1015,16 @@ class ExpressionCoroutineCreation(NodeBase, ExpressionMixin):
         # Make sure the owning module is added to the used set. This is most
         # important for helper functions, or modules, which otherwise have
         # become unused.
-        from nuitka.ModuleRegistry import addUsedModule
-        addUsedModule(owning_module)
+        from nuitka.ModuleRegistry import addUsedModule, getCurrentModule
+        addUsedModule(
+            module       = owning_module,
+            using_module = self.getParentModule()
+        )
 
-        owning_module.addUsedFunction(function_body)
+        owning_module.addUsedFunction(
+            function_body = function_body,
+            using_module  = getCurrentModule()
+        )
 
         from nuitka.optimizations.TraceCollections import \
             ConstraintCollectionFunction
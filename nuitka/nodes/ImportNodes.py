@@ -224,10 +224,16 @@ Not recursing to '%(full_path)s' (%(filename)s), please specify \
 
         if self.getModule() is not None:
             from nuitka.ModuleRegistry import addUsedModule
-            addUsedModule(self.getModule())
+            addUsedModule(
+                module       = self.getModule(),
+                using_module = self.getParentModule()
+            )
 
             for found_module in self.found_modules:
-                addUsedModule(found_module)
+                addUsedModule(
+                    module       = found_module,
+                    using_module = self.getParentModule()
+                )
 
 
         # When a module is recursed to and included, we know it won't raise,
@@ -290,6 +296,12 @@ class ExpressionBuiltinImport(ExpressionChildrenHavingBase):
         "import_name", "globals", "locals", "fromlist", "level"
     )
 
+    clone_arg_names = {
+        "import_name" : "name",
+        "globals"     : "import_globals",
+        "locals"      : "import_locals"
+    }
+
     def __init__(self, name, import_globals, import_locals, fromlist, level,
                 source_ref):
         if fromlist is None:
@@ -380,6 +392,10 @@ class StatementImportStar(StatementChildrenHavingBase):
 
     named_children = ("module",)
 
+    clone_arg_names = {
+        "module" : "module_import"
+    }
+
     def __init__(self, module_import, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
@@ -125,7 +125,10 @@ class PythonModuleMixin:
         if self.package:
             from nuitka.ModuleRegistry import addUsedModule
 
-            addUsedModule(self.package)
+            addUsedModule(
+                module       = self.package,
+                using_module = self
+            )
 
 #            print "Recursed to package", self.package_name
             result.extend(self.package.attemptRecursion())
@@ -210,6 +213,10 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
         self.active_functions = OrderedSet()
         self.cross_used_functions = OrderedSet()
 
+        # The modules whose traversal used a function, so these uses can be
+        # forgotten, when only some modules are traversed again.
+        self.function_users = {}
+
         # SSA trace based information about the module.
         self.constraint_collection = None
 
@@ -223,7 +230,7 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
     def asXml(self):
         result = super(CompiledPythonModule, self).asXml()
 
-        for function_body in self.active_functions:
+        for function_body in self.getUsedFunctions():
             result.append(function_body.asXml())
 
         return result
@@ -344,17 +351,39 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
 
     def startTraversal(self):
         self.active_functions = OrderedSet()
+        self.function_users = {}
 
-    def addUsedFunction(self, function_body):
+    def addUsedFunction(self, function_body, using_module):
         assert function_body in self.functions
 
         assert function_body.isExpressionFunctionBody()
 
         if function_body not in self.active_functions:
             self.active_functions.add(function_body)
+            self.function_users[function_body] = set()
+
+        self.function_users[function_body].add(using_module)
+
+    def removeFunctionUsers(self, using_modules):
+        """ Forget the uses of functions made by traversing these modules. """
+
+        for function_body in tuple(self.active_functions):
+            function_users = self.function_users[function_body]
+            function_users.difference_update(using_modules)
+
+            if not function_users:
+                self.active_functions.discard(function_body)
+                del self.function_users[function_body]
 
     def getUsedFunctions(self):
-        return self.active_functions
+        # In the order of definition, not the one of use, so code names and
+        # code do not depend on the order modules are traversed in.
+        return tuple(
+            function
+            for function in
+            self.functions
+            if function in self.active_functions
+        )
 
     def getUnusedFunctions(self):
         for function in self.functions:
@@ -614,6 +643,9 @@ class PythonShlibModule(PythonModuleMixin, NodeBase):
     def startTraversal(self):
         pass
 
+    def removeFunctionUsers(self, using_modules):
+        pass
+
 
 
 class ExpressionModuleFileAttributeRef(NodeBase, ExpressionMixin):
@@ -309,11 +309,9 @@ class NodeBase(NodeMetaClassBase):
             not being fully compatible, and just drop it altogether.
         """
 
-        # Getting the same source reference can be dealt with quickly, so do
-        # this first.
+        # Source references are interned, so identity is equality here.
         if self.source_ref is not source_ref and \
-           Options.isFullCompat() and \
-           self.source_ref != source_ref:
+           Options.isFullCompat():
             # An attribute outside of "__init__", so we save one memory for the
             # most cases. Very few cases involve splitting across lines.
             # pylint: disable=W0201
@@ -645,6 +643,10 @@ class ChildrenHavingMixin:
 
     checkers = {}
 
+    # Names of the "__init__" arguments for children, where these differ from
+    # the child names, needed for cloning.
+    clone_arg_names = {}
+
     def __init__(self, values):
         assert type(self.named_children) is tuple and len(self.named_children)
 
@@ -810,16 +812,18 @@ class ChildrenHavingMixin:
         for key, value in self.child_values.items():
             assert type(value) is not list, key
 
+            arg_name = self.clone_arg_names.get(key, key)
+
             if value is None:
-                values[key] = None
+                values[arg_name] = None
             elif type(value) is tuple:
-                values[key] = tuple(
+                values[arg_name] = tuple(
                     v.makeClone()
                     for v in
                     value
                 )
             else:
-                values[key] = value.makeClone()
+                values[arg_name] = value.makeClone()
 
         values.update(
             self.getDetails()
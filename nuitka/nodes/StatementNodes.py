@@ -19,6 +19,9 @@
 
 """
 
+from nuitka import Options
+from nuitka.PythonVersions import python_version
+
 from .NodeBases import NodeBase, StatementChildrenHavingBase
 
 
@@ -307,15 +310,31 @@ class StatementPreserveFrameException(NodeBase):
         # For Python2 generators, it's not necessary to preserve, the frame
         # decides it. TODO: This check makes only sense once.
 
-        if self.getParentStatementsFrame().needsExceptionFramePreservation():
-            return self, None, None
-        else:
+        if not self.getParentStatementsFrame().needsExceptionFramePreservation():
             return (
                 None,
                 "new_statements",
                 "Removed frame preservation for generators."
             )
 
+        # For Python2, the frame restores what was preserved, only when there
+        # is a publication left, so they must go away together. For Python3,
+        # the preserved exception is explicitly restored, so we keep it.
+        if python_version < 300:
+            statements = self.getParent().getStatements()
+            index = statements.index(self)
+
+            if index + 1 < len(statements) and \
+               statements[index+1].isStatementPublishException() and \
+               not statements[index+1].isPublicationNeeded():
+                return (
+                    None,
+                    "new_statements",
+                    "Removed frame preservation for unpublished exception."
+                )
+
+        return self, None, None
+
     def mayRaiseException(self, exception_type):
         return False
 
@@ -359,8 +378,125 @@ class StatementPublishException(NodeBase):
         )
 
     def computeStatement(self, constraint_collection):
-        # TODO: Determine the need for it.
+        if not self.isPublicationNeeded():
+            return (
+                None,
+                "new_statements",
+                "Removed publication of exception not visible to handler."
+            )
+
         return self, None, None
 
     def mayRaiseException(self, exception_type):
         return False
+
+    def isPublicationNeeded(self):
+        """ Decide if the exception handler can observe the publication.
+
+        When the handler only matches the exception type, and then does
+        nothing that could raise, call code, or use the exception value, it
+        can work with the unpublished exception as it was raised. It is then
+        not normalized, and gets no traceback, unless it is re-raised and
+        escapes.
+        """
+
+        statements = self.getParent().getStatements()
+        index = statements.index(self)
+
+        for statement in statements[index+1:]:
+            if _needsPublishedException(statement):
+                return True
+
+        # For Python2, the published exception remains visible after the
+        # handler, until the function is left, and to "finally" blocks.
+        if python_version < 300 and Options.isFullCompat():
+            handler = self.getParent()
+
+            if not handler.isStatementAborting() or \
+               handler.mayBreak() or \
+               handler.mayContinue():
+                return True
+
+            node = handler
+
+            while not node.isParentVariableProvider():
+                # Returning from an outline continues the function.
+                if node.isExpressionOutlineBody():
+                    return True
+
+                parent = node.getParent()
+
+                if parent.isStatementTry() and node is parent.getBlockTry():
+                    for parent_handler in (parent.getBlockExceptHandler(),
+                                           parent.getBlockReturnHandler()):
+                        if parent_handler is not None and \
+                           _needsPublishedException(parent_handler):
+                            return True
+
+                node = parent
+
+        return False
+
+
+def _usesCaughtException(node):
+    if node.isExpressionCaughtExceptionValueRef() or \
+       node.isExpressionCaughtExceptionTracebackRef():
+        return True
+
+    for child in node.getVisitableNodes():
+        if _usesCaughtException(child):
+            return True
+
+    return False
+
+
+def _isExceptionTypeMatchOnly(condition):
+    if not condition.isExpressionComparisonExceptionMatch():
+        return False
+
+    if not condition.getLeft().isExpressionCaughtExceptionTypeRef():
+        return False
+
+    right = condition.getRight()
+
+    if right.isExpressionMakeTuple():
+        elements = right.getElements()
+    else:
+        elements = (right,)
+
+    for element in elements:
+        if not element.isExpressionBuiltinExceptionRef():
+            return False
+
+    return True
+
+
+def _needsPublishedException(statement):
+    # Matching the type and branching on it, re-raising, and structure is all
+    # fine, anything that may raise, e.g. a call, might look at it though.
+    if statement.isStatementsSequence():
+        for sub_statement in statement.getStatements():
+            if _needsPublishedException(sub_statement):
+                return True
+
+        return False
+    elif statement.isStatementConditional():
+        if not _isExceptionTypeMatchOnly(statement.getCondition()):
+            return True
+
+        for branch in (statement.getBranchYes(), statement.getBranchNo()):
+            if branch is not None and _needsPublishedException(branch):
+                return True
+
+        return False
+    elif statement.isStatementTry():
+        for block in statement.getVisitableNodes():
+            if _needsPublishedException(block):
+                return True
+
+        return False
+    elif statement.isStatementReraiseException():
+        return False
+    else:
+        return statement.mayRaiseException(BaseException) or \
+               _usesCaughtException(statement)
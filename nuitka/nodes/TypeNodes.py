@@ -93,6 +93,11 @@ class ExpressionBuiltinSuper(ExpressionChildrenHavingBase):
         "object"
     )
 
+    clone_arg_names = {
+        "type"   : "super_type",
+        "object" : "super_object"
+    }
+
     def __init__(self, super_type, super_object, source_ref):
         ExpressionChildrenHavingBase.__init__(
             self,
@@ -26,6 +26,10 @@ from nuitka.nodes.NodeMakingHelpers import makeVariableTargetRefNode
 from nuitka.nodes.OutlineNodes import ExpressionOutlineBody
 from nuitka.tree.Extractions import updateVariableUsage
 from nuitka.tree.Helpers import makeStatementsSequence
+from nuitka.tree.ReformulationTryExceptStatements import (
+    makeTryExceptSingleHandlerNode
+)
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
 
 
 def convertFunctionCallToOutline(provider, function_ref, values):
@@ -93,3 +97,153 @@ def convertFunctionCallToOutline(provider, function_ref, values):
     outline_body.setBody(body)
 
     return outline_body
+
+
+class GeneratorExpressionInliningVisitor(VisitorNoopMixin):
+    """ Collect the nodes of a generator expression body that in-lining changes.
+
+        Also decides if the body is suitable for in-lining at all, which it is
+        not, if it creates functions, or uses "locals" or "super".
+    """
+    def __init__(self):
+        self.entries = []
+        self.yields = []
+        self.frames = []
+
+        self.inlinable = True
+
+    def onEnterNode(self, node):
+        if node.isStatementGeneratorEntry():
+            self.entries.append(node)
+        elif node.isExpressionYield():
+            if not node.getParent().isStatementExpressionOnly():
+                self.inlinable = False
+
+            self.yields.append(node)
+        elif node.isStatementsFrame():
+            self.frames.append(node)
+        elif node.isExpressionFunctionRef() or \
+             node.isExpressionYieldFrom() or \
+             node.isExpressionBuiltinLocals() or \
+             node.isExpressionBuiltinSuper():
+            self.inlinable = False
+
+
+def _getGeneratorExpressionBody(node):
+    if not node.isExpressionFunctionCall():
+        return None
+
+    function_body = node.getFunction().getFunctionRef().getFunctionBody()
+
+    if not function_body.isGenerator() or \
+       not function_body.isGeneratorExpression():
+        return None
+
+    return function_body
+
+
+def isInlinableGeneratorExpression(node):
+    """ Decide if a generator expression can be in-lined into its consumer.
+
+        Only calls of generator expression bodies qualify, that do not share
+        their variables with anything else.
+    """
+    function_body = _getGeneratorExpressionBody(node)
+
+    if function_body is None:
+        return False
+
+    for variable in function_body.getLocalVariables():
+        if variable.isSharedTechnically():
+            return False
+
+    visitor = GeneratorExpressionInliningVisitor()
+    visitTree(function_body.getBody(), visitor)
+
+    return visitor.inlinable and len(visitor.frames) == 1
+
+
+def convertGeneratorExpressionToStatements(outline_body, generator_call,
+                                           makeValueStatements):
+    """ Turn a generator expression call into statements of an outline.
+
+        Instead of yielding values, the statements produced for each value by
+        "makeValueStatements" are executed. The frame of the generator
+        expression is kept, so tracebacks look the same. A "StopIteration"
+        raised by the body ends the values, as it would end the generator.
+        Returns the statements and the variables that need to be released
+        after them.
+    """
+
+    assert isInlinableGeneratorExpression(generator_call)
+
+    function_body = _getGeneratorExpressionBody(generator_call)
+
+    source_ref = generator_call.getSourceReference()
+
+    clone = function_body.getBody().makeClone()
+
+    temp_scope = outline_body.getOutlineTempScope()
+
+    translation = {}
+
+    for variable in function_body.getLocalVariables() + \
+                    list(function_body.getTempVariables()):
+        new_variable = outline_body.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = variable.getName()
+        )
+
+        updateVariableUsage(
+            clone,
+            old_variable = variable,
+            new_variable = new_variable
+        )
+
+        translation[variable.getName()] = new_variable
+
+    visitor = GeneratorExpressionInliningVisitor()
+    visitTree(clone, visitor)
+
+    for entry in visitor.entries:
+        entry.getParent().removeStatement(entry)
+
+    for yield_node in visitor.yields:
+        statement = yield_node.getParent()
+        statement_sequence = statement.getParent()
+
+        statements = list(statement_sequence.getStatements())
+        position = statements.index(statement)
+
+        statements[position:position+1] = makeValueStatements(
+            yield_node.getExpression()
+        )
+
+        statement_sequence.setStatements(statements)
+
+    frame, = visitor.frames
+    frame.markAsInlined(function_body)
+
+    argument_name, = function_body.getParameters().getAllNames()
+    value, = generator_call.getArgumentValues()
+
+    statements = [
+        StatementAssignmentVariable(
+            variable_ref = makeVariableTargetRefNode(
+                variable   = translation[argument_name],
+                source_ref = source_ref
+            ),
+            source       = value,
+            source_ref   = source_ref,
+        )
+    ]
+    statements.append(
+        makeTryExceptSingleHandlerNode(
+            tried          = clone,
+            exception_name = "StopIteration",
+            handler_body   = None,
+            source_ref     = source_ref
+        )
+    )
+
+    return statements, list(translation.values())
@@ -27,6 +27,7 @@ import inspect
 from logging import debug, warning
 
 from nuitka import ModuleRegistry, Options, VariableRegistry
+from nuitka.containers.oset import OrderedSet
 from nuitka.optimizations import TraceCollections
 from nuitka.plugins.PluginBase import Plugins
 from nuitka.Tracing import printLine
@@ -269,6 +270,25 @@ def optimizeVariables(module):
     optimizeUnusedTempVariables(module)
 
 
+def _dropModuleCollections(module):
+    """ Unregister the collection traces of a module that became unused.
+
+        The assignments it made to variables of other modules, e.g. as in
+        "other_module.attribute = value", no longer happen, and must not
+        prevent their optimization.
+    """
+    for collection in module.getTraceCollections():
+        VariableRegistry.updateFromCollection(
+            old_collection = collection,
+            new_collection = None
+        )
+
+    for function in module.getUsedFunctions():
+        function.constraint_collection = None
+
+    module.constraint_collection = None
+
+
 def optimize():
     # This is somewhat complex with many cases, pylint: disable=R0912
 
@@ -283,10 +303,20 @@ def optimize():
         except ImportError:
             warning("Cannot import graphviz module, no graphing capability.")
 
+    # Modules changed in the last pass, "None" means all modules need to be
+    # traversed again.
+    changed_modules = None
+
     while True:
-        finished = True
+        previous_modules = set(ModuleRegistry.getDoneModules())
 
-        ModuleRegistry.startTraversal()
+        if changed_modules is None or \
+           not Options.isIncrementalOptimization():
+            ModuleRegistry.startTraversal()
+        else:
+            ModuleRegistry.startIncrementalTraversal(changed_modules)
+
+        changed_modules = OrderedSet()
 
         while True:
             current_module = ModuleRegistry.nextModule()
@@ -311,12 +341,38 @@ after that. Memory usage {memory}:""".format(
                 changed = optimizePythonModule(current_module)
 
                 if changed:
-                    finished = False
+                    changed_modules.add(current_module)
+
+        ModuleRegistry.finishTraversal()
+
+        # Modules whose imports all got optimized away are not compiled, and
+        # their traces must not be considered for the whole program anymore.
+        dropped_modules = previous_modules.difference(
+            ModuleRegistry.getDoneModules()
+        )
+
+        for dropped_module in sorted(dropped_modules, key = lambda module : module.getFullName()):
+            if _progress:
+                printLine(
+                    "Dropping module '{module_name}', it is no longer used.".format(
+                        module_name = dropped_module.getFullName()
+                    )
+                )
+
+            if not dropped_module.isPythonShlibModule() and \
+               dropped_module.constraint_collection is not None:
+                _dropModuleCollections(dropped_module)
+
+                # Others may now optimize better, look at all modules again.
+                changed_modules = None
 
         # Unregister collection traces from now unused code.
         for current_module in ModuleRegistry.getDoneModules():
             if not current_module.isPythonShlibModule():
                 for function in current_module.getUnusedFunctions():
+                    if function.constraint_collection is None:
+                        continue
+
                     VariableRegistry.updateFromCollection(
                         old_collection = function.constraint_collection,
                         new_collection = None
@@ -324,16 +380,22 @@ after that. Memory usage {memory}:""".format(
 
                     function.constraint_collection = None
 
+                    # The module may optimize better without it, and it is
+                    # not necessarily traversed again otherwise.
+                    if changed_modules is not None:
+                        changed_modules.add(current_module)
+
         if not VariableRegistry.complete:
             VariableRegistry.complete = True
 
-            finished = False
+            # With complete information, every module may change.
+            changed_modules = None
 
         for current_module in ModuleRegistry.getDoneModules():
             if not current_module.isPythonShlibModule():
                 optimizeVariables(current_module)
 
-        if finished:
+        if changed_modules is not None and not changed_modules:
             break
 
 
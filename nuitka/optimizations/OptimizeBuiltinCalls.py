@@ -28,7 +28,8 @@ from nuitka.nodes.AssignNodes import (
     ExpressionTargetTempVariableRef,
     ExpressionTempVariableRef,
     StatementAssignmentVariable,
-    StatementDelVariable
+    StatementDelVariable,
+    StatementReleaseVariable
 )
 from nuitka.nodes.AttributeNodes import (
     ExpressionAttributeLookup,
@@ -89,6 +90,14 @@ from nuitka.nodes.ConditionalNodes import (
     StatementConditional
 )
 from nuitka.nodes.ConstantRefNodes import ExpressionConstantRef
+from nuitka.nodes.ContainerOperationNodes import (
+    ExpressionListOperationAppend,
+    ExpressionSetOperationAdd
+)
+from nuitka.nodes.ExceptionNodes import (
+    ExpressionBuiltinMakeException,
+    StatementRaiseExceptionImplicit
+)
 from nuitka.nodes.ExecEvalNodes import (
     ExpressionBuiltinCompile,
     ExpressionBuiltinEval
@@ -100,17 +109,22 @@ from nuitka.nodes.GlobalsLocalsNodes import (
 )
 from nuitka.nodes.ImportNodes import ExpressionBuiltinImport
 from nuitka.nodes.NodeMakingHelpers import (
+    makeComparisonNode,
     makeRaiseExceptionReplacementExpression,
     makeRaiseExceptionReplacementExpressionFromInstance,
     wrapExpressionWithSideEffects
 )
 from nuitka.nodes.OperatorNodes import (
+    ExpressionOperationBinary,
     ExpressionOperationNOT,
     ExpressionOperationUnary
 )
 from nuitka.nodes.OutlineNodes import ExpressionOutlineBody
 from nuitka.nodes.ReturnNodes import StatementReturn
-from nuitka.nodes.StatementNodes import StatementsSequence
+from nuitka.nodes.StatementNodes import (
+    StatementExpressionOnly,
+    StatementsSequence
+)
 from nuitka.nodes.TypeNodes import (
     ExpressionBuiltinIsinstance,
     ExpressionBuiltinSuper,
@@ -129,6 +143,10 @@ from nuitka.utils.Utils import python_version
 from nuitka.VariableRegistry import addVariableUsage
 
 from . import BuiltinOptimization
+from .FunctionInlining import (
+    convertGeneratorExpressionToStatements,
+    isInlinableGeneratorExpression
+)
 
 
 def dir_extractor(node):
@@ -408,6 +426,16 @@ def len_extractor(node):
     )
 
 def tuple_extractor(node):
+    generator_call = _getGeneratorExpressionArg(node)
+
+    if generator_call is not None:
+        return _makeGeneratorExpressionOutline(
+            node           = node,
+            generator_call = generator_call,
+            name           = "tuple",
+            makeConsumer   = _makeTupleConsumer
+        )
+
     return BuiltinOptimization.extractBuiltinArgs(
         node          = node,
         builtin_class = ExpressionBuiltinTuple,
@@ -415,6 +443,16 @@ def tuple_extractor(node):
     )
 
 def list_extractor(node):
+    generator_call = _getGeneratorExpressionArg(node)
+
+    if generator_call is not None:
+        return _makeGeneratorExpressionOutline(
+            node           = node,
+            generator_call = generator_call,
+            name           = "list",
+            makeConsumer   = _makeListConsumer
+        )
+
     return BuiltinOptimization.extractBuiltinArgs(
         node          = node,
         builtin_class = ExpressionBuiltinList,
@@ -422,6 +460,16 @@ def list_extractor(node):
     )
 
 def set_extractor(node):
+    generator_call = _getGeneratorExpressionArg(node)
+
+    if generator_call is not None:
+        return _makeGeneratorExpressionOutline(
+            node           = node,
+            generator_call = generator_call,
+            name           = "set",
+            makeConsumer   = _makeSetConsumer
+        )
+
     return BuiltinOptimization.extractBuiltinArgs(
         node          = node,
         builtin_class = ExpressionBuiltinSet,
@@ -601,10 +649,10 @@ def eval_extractor(node):
 
         # The wrapping should not relocate to the "source_ref".
         assert globals_arg is None or \
-               globals_ref.getSourceReference() == \
+               globals_ref.getSourceReference() is \
                globals_arg.getSourceReference()
         assert locals_arg is None or \
-               locals_ref.getSourceReference() == \
+               locals_ref.getSourceReference() is \
                locals_arg.getSourceReference()
 
         source_variable = outline_body.allocateTempVariable(
@@ -1005,6 +1053,446 @@ def hash_extractor(node):
     )
 
 
+def _getGeneratorExpressionArg(node):
+    """ The generator expression that is the only argument of a call or None.
+
+    """
+    if node.getCallKw() is not None:
+        return None
+
+    args = node.getCallArgs()
+
+    if args is None or not args.canPredictIterationValues():
+        return None
+
+    positional = args.getIterationValues()
+
+    if len(positional) != 1 or \
+       not isInlinableGeneratorExpression(positional[0]):
+        return None
+
+    return positional[0]
+
+
+def _makeGeneratorExpressionOutline(node, generator_call, name, makeConsumer):
+    """ Consume the values of a generator expression in-line.
+
+        The consumer provides statements to start with, statements for each
+        value, and statements to end with, which produce the result. This
+        avoids creating a generator object and resuming it for every value.
+    """
+    source_ref = node.getSourceReference()
+
+    outline_body = ExpressionOutlineBody(
+        provider   = node.getParentVariableProvider(),
+        name       = name,
+        source_ref = source_ref
+    )
+
+    start, makeValueStatements, end, variables = makeConsumer(
+        outline_body = outline_body,
+        source_ref   = source_ref
+    )
+
+    statements, inlined_variables = convertGeneratorExpressionToStatements(
+        outline_body        = outline_body,
+        generator_call      = generator_call,
+        makeValueStatements = makeValueStatements
+    )
+
+    final = [
+        StatementReleaseVariable(
+            variable   = variable,
+            source_ref = source_ref
+        )
+        for variable in
+        variables + inlined_variables
+    ]
+
+    outline_body.setBody(
+        makeStatementsSequenceFromStatement(
+            statement = makeTryFinallyStatement(
+                provider   = outline_body,
+                tried      = start + statements + end,
+                final      = final,
+                source_ref = source_ref
+            )
+        )
+    )
+
+    return outline_body
+
+
+def _makeReturnConstant(constant, source_ref):
+    return StatementReturn(
+        expression = ExpressionConstantRef(
+            constant   = constant,
+            source_ref = source_ref
+        ),
+        source_ref = source_ref
+    )
+
+
+def _makeAssignment(variable, source, source_ref):
+    return StatementAssignmentVariable(
+        variable_ref = ExpressionTargetTempVariableRef(
+            variable   = variable,
+            source_ref = source_ref
+        ),
+        source       = source,
+        source_ref   = source_ref
+    )
+
+
+def _makeAccumulatorConsumer(outline_body, initial, makeUpdate, makeResult,
+                             source_ref):
+    result_variable = outline_body.allocateTempVariable(
+        temp_scope = None,
+        name       = "accumulator"
+    )
+
+    start = [
+        _makeAssignment(
+            variable   = result_variable,
+            source     = ExpressionConstantRef(
+                constant   = initial,
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+    ]
+
+    def makeValueStatements(value):
+        return [
+            makeUpdate(
+                ExpressionTempVariableRef(
+                    variable   = result_variable,
+                    source_ref = source_ref
+                ),
+                value
+            )
+        ]
+
+    end = [
+        StatementReturn(
+            expression = makeResult(
+                ExpressionTempVariableRef(
+                    variable   = result_variable,
+                    source_ref = source_ref
+                )
+            ),
+            source_ref = source_ref
+        )
+    ]
+
+    return start, makeValueStatements, end, [result_variable]
+
+
+def _makeSumConsumer(outline_body, source_ref):
+    def makeUpdate(result_ref, value):
+        return _makeAssignment(
+            variable   = result_ref.getVariable(),
+            source     = ExpressionOperationBinary(
+                operator   = "Add",
+                left       = result_ref,
+                right      = value,
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+
+    return _makeAccumulatorConsumer(
+        outline_body = outline_body,
+        initial      = 0,
+        makeUpdate   = makeUpdate,
+        makeResult   = lambda result_ref: result_ref,
+        source_ref   = source_ref
+    )
+
+
+def _makeListConsumer(outline_body, source_ref):
+    def makeUpdate(result_ref, value):
+        return StatementExpressionOnly(
+            expression = ExpressionListOperationAppend(
+                list_arg   = result_ref,
+                value      = value,
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+
+    return _makeAccumulatorConsumer(
+        outline_body = outline_body,
+        initial      = [],
+        makeUpdate   = makeUpdate,
+        makeResult   = lambda result_ref: result_ref,
+        source_ref   = source_ref
+    )
+
+
+def _makeTupleConsumer(outline_body, source_ref):
+    start, makeValueStatements, _end, variables = _makeListConsumer(
+        outline_body = outline_body,
+        source_ref   = source_ref
+    )
+
+    result_variable, = variables
+
+    end = [
+        StatementReturn(
+            expression = ExpressionBuiltinTuple(
+                value      = ExpressionTempVariableRef(
+                    variable   = result_variable,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+    ]
+
+    return start, makeValueStatements, end, variables
+
+
+def _makeSetConsumer(outline_body, source_ref):
+    def makeUpdate(result_ref, value):
+        return StatementExpressionOnly(
+            expression = ExpressionSetOperationAdd(
+                set_arg    = result_ref,
+                value      = value,
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+
+    return _makeAccumulatorConsumer(
+        outline_body = outline_body,
+        initial      = set(),
+        makeUpdate   = makeUpdate,
+        makeResult   = lambda result_ref: result_ref,
+        source_ref   = source_ref
+    )
+
+
+def _makeTruthConsumer(stop_value):
+    # The values of "any" and "all" are tested until one decides the result.
+    def makeConsumer(outline_body, source_ref):
+        # Signature fits the other consumers, pylint: disable=W0613
+
+        def makeValueStatements(value):
+            if not stop_value:
+                value = ExpressionOperationNOT(
+                    operand    = value,
+                    source_ref = source_ref
+                )
+
+            return [
+                StatementConditional(
+                    condition  = value,
+                    yes_branch = makeStatementsSequenceFromStatement(
+                        statement = _makeReturnConstant(
+                            constant   = stop_value,
+                            source_ref = source_ref
+                        )
+                    ),
+                    no_branch  = None,
+                    source_ref = source_ref
+                )
+            ]
+
+        end = [
+            _makeReturnConstant(
+                constant   = not stop_value,
+                source_ref = source_ref
+            )
+        ]
+
+        return [], makeValueStatements, end, []
+
+    return makeConsumer
+
+
+def _makeExtremeConsumer(builtin_name, comparator):
+    # The values of "min" and "max" are compared to the best one found so
+    # far, which is taken over without comparison for the first value.
+    def makeConsumer(outline_body, source_ref):
+        result_variable = outline_body.allocateTempVariable(
+            temp_scope = None,
+            name       = "extreme"
+        )
+        value_variable = outline_body.allocateTempVariable(
+            temp_scope = None,
+            name       = "value"
+        )
+        first_variable = outline_body.allocateTempVariable(
+            temp_scope = None,
+            name       = "first"
+        )
+
+        def makeFirstRef():
+            return ExpressionTempVariableRef(
+                variable   = first_variable,
+                source_ref = source_ref
+            )
+
+        def makeTakeValue():
+            return makeStatementsSequenceFromStatement(
+                statement = _makeAssignment(
+                    variable   = result_variable,
+                    source     = ExpressionTempVariableRef(
+                        variable   = value_variable,
+                        source_ref = source_ref
+                    ),
+                    source_ref = source_ref
+                )
+            )
+
+        start = [
+            _makeAssignment(
+                variable   = first_variable,
+                source     = ExpressionConstantRef(
+                    constant   = True,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        ]
+
+        def makeValueStatements(value):
+            return [
+                _makeAssignment(
+                    variable   = value_variable,
+                    source     = value,
+                    source_ref = source_ref
+                ),
+                StatementConditional(
+                    condition  = makeFirstRef(),
+                    yes_branch = makeStatementsSequence(
+                        statements = (
+                            _makeAssignment(
+                                variable   = first_variable,
+                                source     = ExpressionConstantRef(
+                                    constant   = False,
+                                    source_ref = source_ref
+                                ),
+                                source_ref = source_ref
+                            ),
+                            makeTakeValue()
+                        ),
+                        allow_none = False,
+                        source_ref = source_ref
+                    ),
+                    no_branch  = makeStatementsSequenceFromStatement(
+                        statement = StatementConditional(
+                            condition  = makeComparisonNode(
+                                left       = ExpressionTempVariableRef(
+                                    variable   = value_variable,
+                                    source_ref = source_ref
+                                ),
+                                right      = ExpressionTempVariableRef(
+                                    variable   = result_variable,
+                                    source_ref = source_ref
+                                ),
+                                comparator = comparator,
+                                source_ref = source_ref
+                            ),
+                            yes_branch = makeTakeValue(),
+                            no_branch  = None,
+                            source_ref = source_ref
+                        )
+                    ),
+                    source_ref = source_ref
+                )
+            ]
+
+        end = [
+            StatementConditional(
+                condition  = makeFirstRef(),
+                yes_branch = makeStatementsSequenceFromStatement(
+                    statement = StatementRaiseExceptionImplicit(
+                        exception_type  = ExpressionBuiltinMakeException(
+                            exception_name = "ValueError",
+                            args           = (
+                                ExpressionConstantRef(
+                                    constant      = "%s() arg is an empty sequence" % (
+                                        builtin_name
+                                    ),
+                                    source_ref    = source_ref,
+                                    user_provided = True
+                                ),
+                            ),
+                            source_ref     = source_ref
+                        ),
+                        exception_value = None,
+                        exception_trace = None,
+                        exception_cause = None,
+                        source_ref      = source_ref
+                    )
+                ),
+                no_branch  = None,
+                source_ref = source_ref
+            ),
+            StatementReturn(
+                expression = ExpressionTempVariableRef(
+                    variable   = result_variable,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        ]
+
+        return (
+            start,
+            makeValueStatements,
+            end,
+            [result_variable, value_variable, first_variable]
+        )
+
+    return makeConsumer
+
+
+def _makeGeneratorExpressionExtractor(builtin_name, makeConsumer):
+    """ Extractor for built-ins that are only optimized for generator expressions.
+
+    """
+    def extractor(node):
+        generator_call = _getGeneratorExpressionArg(node)
+
+        if generator_call is None:
+            return None
+
+        return _makeGeneratorExpressionOutline(
+            node           = node,
+            generator_call = generator_call,
+            name           = builtin_name,
+            makeConsumer   = makeConsumer
+        )
+
+    return extractor
+
+
+sum_extractor = _makeGeneratorExpressionExtractor(
+    builtin_name = "sum",
+    makeConsumer = _makeSumConsumer
+)
+any_extractor = _makeGeneratorExpressionExtractor(
+    builtin_name = "any",
+    makeConsumer = _makeTruthConsumer(True)
+)
+all_extractor = _makeGeneratorExpressionExtractor(
+    builtin_name = "all",
+    makeConsumer = _makeTruthConsumer(False)
+)
+min_extractor = _makeGeneratorExpressionExtractor(
+    builtin_name = "min",
+    makeConsumer = _makeExtremeConsumer("min", "Lt")
+)
+max_extractor = _makeGeneratorExpressionExtractor(
+    builtin_name = "max",
+    makeConsumer = _makeExtremeConsumer("max", "Gt")
+)
+
+
 _dispatch_dict = {
     "compile"    : compile_extractor,
     "globals"    : globals_extractor,
@@ -1042,7 +1530,12 @@ _dispatch_dict = {
     # TODO: Disabled for now, not handling all cases.
     # "bytearray"  : bytearray_extractor,
     "slice"      : slice_extractor,
-    "hash"       : hash_extractor
+    "hash"       : hash_extractor,
+    "sum"        : sum_extractor,
+    "any"        : any_extractor,
+    "all"        : all_extractor,
+    "min"        : min_extractor,
+    "max"        : max_extractor
 }
 
 if python_version < 300:
@@ -111,7 +111,8 @@ class NuitkaPluginBase:
                     module_filename = module_filename,
                     module_kind     = module_kind,
                     reason          = reason,
-                    signal_change   = signal_change
+                    signal_change   = signal_change,
+                    using_module    = module
                 )
 
     def getImplicitImports(self, full_name):
@@ -233,7 +234,7 @@ class NuitkaPluginBase:
 
     @staticmethod
     def recurseTo(module_package, module_filename, module_kind, reason,
-                  signal_change):
+                  signal_change, using_module = None):
         from nuitka.importing import Recursion
 
         imported_module, added_flag = Recursion.recurseTo(
@@ -244,7 +245,10 @@ class NuitkaPluginBase:
             reason          = reason
         )
 
-        addUsedModule(imported_module)
+        addUsedModule(
+            module       = imported_module,
+            using_module = using_module
+        )
 
         if added_flag:
             signal_change(
@@ -426,10 +430,16 @@ class Plugins:
         full_name = module.getFullName()
 
         if full_name in post_modules:
-            addUsedModule(post_modules[full_name])
+            addUsedModule(
+                module       = post_modules[full_name],
+                using_module = module
+            )
 
         if full_name in pre_modules:
-            addUsedModule(pre_modules[full_name])
+            addUsedModule(
+                module       = pre_modules[full_name],
+                using_module = module
+            )
 
     @staticmethod
     def considerExtraDlls(dist_dir, module):
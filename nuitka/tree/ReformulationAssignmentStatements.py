@@ -116,6 +116,35 @@ def buildExtSliceNode(provider, node, source_ref):
     )
 
 
+def _getUnpackedSourceValues(source, count):
+    """ Values of a sequence created only to be unpacked, if any.
+
+        When the source is a tuple or list built in place with exactly as many
+        values as there are targets, the sequence cannot escape, and its
+        values can be assigned directly, without creating it.
+    """
+    if source.isExpressionMakeTuple() or source.isExpressionMakeList():
+        values = source.getElements()
+    elif source.isExpressionConstantRef() and \
+         type(source.getConstant()) in (tuple, list):
+        values = [
+            ExpressionConstantRef(
+                constant      = constant,
+                source_ref    = source.getSourceReference(),
+                user_provided = True
+            )
+            for constant in
+            source.getConstant()
+        ]
+    else:
+        return None
+
+    if len(values) != count:
+        return None
+
+    return values
+
+
 def buildAssignmentStatementsFromDecoded(provider, kind, detail, source,
                                          source_ref):
     # This is using many variable names on purpose, so as to give names to the
@@ -178,6 +207,20 @@ def buildAssignmentStatementsFromDecoded(provider, kind, detail, source,
                 source_ref = source_ref
             )
     elif kind == "Tuple":
+        if not any(element[0] == "Starred" for element in detail):
+            source_values = _getUnpackedSourceValues(
+                source = source,
+                count  = len(detail)
+            )
+
+            if source_values is not None:
+                return _buildAssignmentStatementsFromValues(
+                    provider      = provider,
+                    detail        = detail,
+                    source_values = source_values,
+                    source_ref    = source_ref
+                )
+
         temp_scope = provider.allocateTempScope("tuple_unpack")
 
         source_iter_var = provider.allocateTempVariable(
@@ -348,6 +391,67 @@ def buildAssignmentStatementsFromDecoded(provider, kind, detail, source,
         assert False, (kind, source_ref, detail)
 
 
+def _buildAssignmentStatementsFromValues(provider, detail, source_values,
+                                         source_ref):
+    # All values are computed before any target is assigned, just as they
+    # would be for the sequence creation.
+    temp_scope = provider.allocateTempScope("tuple_unpack")
+
+    element_vars = [
+        provider.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = "element_%d" % (
+                element_index + 1
+            )
+        )
+        for element_index in
+        range(len(detail))
+    ]
+
+    statements = [
+        StatementAssignmentVariable(
+            variable_ref = ExpressionTargetTempVariableRef(
+                variable   = element_var,
+                source_ref = source_ref
+            ),
+            source       = source_value,
+            source_ref   = source_ref
+        )
+        for element_var, source_value in
+        zip(element_vars, source_values)
+    ]
+
+    for element, element_var in zip(detail, element_vars):
+        statements.append(
+            buildAssignmentStatementsFromDecoded(
+                provider   = provider,
+                kind       = element[0],
+                detail     = element[1],
+                source     = ExpressionTempVariableRef(
+                    variable   = element_var,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        )
+
+    final_statements = [
+        StatementReleaseVariable(
+            variable   = element_var,
+            source_ref = source_ref
+        )
+        for element_var in
+        element_vars
+    ]
+
+    return makeTryFinallyStatement(
+        provider   = provider,
+        tried      = statements,
+        final      = final_statements,
+        source_ref = source_ref
+    )
+
+
 def buildAssignmentStatements(provider, node, source, source_ref,
                               allow_none = False, temp_provider = None):
     if node is None and allow_none:
@@ -34,6 +34,10 @@ from nuitka.nodes.BuiltinIteratorNodes import (
 )
 from nuitka.nodes.ConditionalNodes import StatementConditional
 from nuitka.nodes.ConstantRefNodes import ExpressionConstantRef
+from nuitka.nodes.ContainerMakingNodes import (
+    ExpressionMakeDictForIterator,
+    ExpressionMakeListForIterator
+)
 from nuitka.nodes.ContainerOperationNodes import (
     ExpressionDictOperationSet,
     ExpressionListOperationAppend,
@@ -90,6 +94,7 @@ def buildListContractionNode(provider, node, source_ref):
             constant   = [],
             source_ref = source_ref
         ),
+        presized_class  = ExpressionMakeListForIterator,
         # Note: For Python3, the list contractions no longer assign to the outer
         # scope.
         assign_provider = Utils.python_version < 300,
@@ -109,6 +114,7 @@ def buildSetContractionNode(provider, node, source_ref):
             constant   = set(),
             source_ref = source_ref
         ),
+        presized_class  = None,
         assign_provider = False,
         source_ref      = source_ref
     )
@@ -126,6 +132,7 @@ def buildDictContractionNode(provider, node, source_ref):
             constant   = {},
             source_ref = source_ref
         ),
+        presized_class  = ExpressionMakeDictForIterator,
         assign_provider = False,
         source_ref      = source_ref
     )
@@ -142,14 +149,16 @@ def buildGeneratorExpressionNode(provider, node, source_ref):
         name            = "<genexpr>",
         emit_class      = ExpressionYield,
         start_value     = None,
+        presized_class  = None,
         assign_provider = False,
         source_ref      = source_ref
     )
 
 
 def _buildContractionBodyNode(provider, node, emit_class, start_value,
-                              container_tmp, iter_tmp, temp_scope,
-                              assign_provider, source_ref, function_body):
+                              presized_class, container_tmp, iter_tmp,
+                              temp_scope, assign_provider, source_ref,
+                              function_body):
 
     # This uses lots of variables and branches. There is no good way
     # around that, and we deal with many cases, due to having generator
@@ -184,6 +193,19 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
     else:
         statements = []
 
+    # With only one iteration and no conditions, all values of the iterator
+    # become items, so the container can be created with room for them.
+    if presized_class is not None and \
+       len(node.generators) == 1 and \
+       not node.generators[0].ifs:
+        start_value = presized_class(
+            iterator   = makeVariableRefNode(
+                variable   = iter_tmp,
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+
     if start_value is not None:
         statements.append(
             StatementAssignmentVariable(
@@ -406,7 +428,7 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
 
 
 def _buildContractionNode(provider, node, name, emit_class, start_value,
-                          assign_provider, source_ref):
+                          presized_class, assign_provider, source_ref):
     # The contraction nodes are reformulated to function bodies, with loops as
     # described in the developer manual. They use a lot of temporary names,
     # nested blocks, etc. and so a lot of variable names.
@@ -484,6 +506,7 @@ def _buildContractionNode(provider, node, name, emit_class, start_value,
         iter_tmp        = iter_tmp,
         temp_scope      = None,
         start_value     = start_value,
+        presized_class  = presized_class,
         container_tmp   = container_tmp,
         source_ref      = source_ref,
     )
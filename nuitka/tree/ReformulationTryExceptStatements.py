@@ -181,7 +181,7 @@ def _makeTryExceptSingleHandlerNode(provider, public_exc, tried, exception_name,
     else:
         handling = []
 
-    if not handler_body.isStatementsSequence():
+    if handler_body is not None and not handler_body.isStatementsSequence():
         handler_body = makeStatementsSequenceFromStatement(
             statement = handler_body
         )
@@ -252,6 +252,67 @@ def globalErrors():
     except NameError as e:
         print("Del on unassigned global gives", repr(e))
 
+def inPlaceSequenceUnpacks():
+    # Sequences built in place only to be unpacked are not created, and their
+    # values are assigned directly, that must behave the same.
+
+    def value(v):
+        print("Computing value", v)
+        return v
+
+    class Target(object):
+        def __setitem__(self, key, v):
+            print("Assigning item", key, "to", v)
+
+    t = Target()
+
+    print("Unpack order, values first, then targets:")
+    t[value(1)], t[value(2)] = value(3), value(4)
+
+    a = b = c = "unchanged"
+
+    print("Unpack with a value raising:", end = ' ')
+
+    try:
+        a, b, c = value(1), 1 / 0, value(3)
+    except ZeroDivisionError as e:
+        print("gives", repr(e), "and nothing is assigned", a, b, c)
+
+    a, (b, c) = 1, (2, 3)
+    print("Nested unpack from tuple:", a, b, c)
+
+    a, (b, c) = 4, [5, 6]
+    print("Nested unpack from list:", a, b, c)
+
+    x = [0, 0]
+    i = 0
+    x[i], i = 5, 1
+    print("Subscript target using later target:", x, i)
+
+    x = [0, 0]
+    i = 0
+    i, x[i] = 1, 5
+    print("Subscript target using earlier target:", x, i)
+
+    class C(object):
+        pass
+
+    o = C()
+    p = C()
+    o.attr, o = 1, p
+    print("Attribute target using later target:", o is p, hasattr(p, "attr"))
+
+    a, b = b, a
+    print("Swap with in-place tuple:", a, b)
+
+    a, b = [1, 2]
+    print("Unpack constant list:", a, b)
+
+    try:
+        a, b = [1, 2, 3]
+    except ValueError as e:
+        print("Unpack too long constant list gives", repr(e))
+
 
 someFunction()
 varargsFunction(1,2,3,4)
@@ -264,3 +325,4 @@ optimizeableTargets()
 complexDel()
 sliceDel()
 globalErrors()
+inPlaceSequenceUnpacks()
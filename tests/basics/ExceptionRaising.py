@@ -612,3 +612,90 @@ def checkRaiseExceptionDictBuildingList(arg):
 
 print("Check if list raises:")
 checkRaiseExceptionDictBuildingList(4)
+
+# Handlers that only match the exception and then do nothing with it need not
+# publish it, but what is visible afterwards must be the same.
+def checkExcInfoAfterFallThroughHandler():
+    try:
+        raise KeyError(1)
+    except KeyError:
+        pass
+
+    print("After handler falling through", sys.exc_info()[0])
+
+print("Check exception info after handlers:")
+checkExcInfoAfterFallThroughHandler()
+
+def checkExcInfoAfterContinueHandler():
+    for i in range(2):
+        try:
+            raise KeyError(i)
+        except KeyError:
+            continue
+
+    print("After handler continuing loop", sys.exc_info()[0])
+
+checkExcInfoAfterContinueHandler()
+
+def returnFromHandler():
+    try:
+        raise IndexError(1)
+    except IndexError:
+        return 1
+
+def checkExcInfoAfterReturnHandler():
+    print("Before returning handler", sys.exc_info()[0])
+    returnFromHandler()
+    print("After returning handler", sys.exc_info()[0])
+
+    try:
+        raise TypeError(2)
+    except TypeError:
+        returnFromHandler()
+
+        print("After returning handler in handler", sys.exc_info()[0])
+
+checkExcInfoAfterReturnHandler()
+
+def raiseAfterHandler():
+    try:
+        raise KeyError(3)
+    except KeyError:
+        pass
+
+    raise
+
+def checkBareRaiseAfterHandler():
+    try:
+        raiseAfterHandler()
+    except Exception as e:
+        print("Bare raise after handler gives", repr(e))
+
+print("Check bare raise after handler:")
+checkBareRaiseAfterHandler()
+
+def raiseValueError():
+    raise ValueError(4)
+
+def reraiseFromUnpublishedHandler():
+    try:
+        raiseValueError()
+    except ValueError:
+        raise
+
+def checkReraiseTraceback():
+    try:
+        reraiseFromUnpublishedHandler()
+    except ValueError:
+        tb = sys.exc_info()[2]
+
+        while tb is not None:
+            print(
+                "Re-raised traceback has",
+                tb.tb_frame.f_code.co_name,
+                tb.tb_lineno
+            )
+            tb = tb.tb_next
+
+print("Check traceback of re-raise from handler:")
+checkReraiseTraceback()
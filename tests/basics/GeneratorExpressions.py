@@ -227,3 +227,47 @@ def strangeLambdaGeneratorExpression():
     print(list(x))
 
 strangeLambdaGeneratorExpression()
+
+def builtinCallsInConsumedGeneratorExpressions():
+    # These generator expressions are consumed by built-ins and in-lined,
+    # which clones their bodies, so all the nodes need to support that.
+
+    class C(object):
+        def method(self):
+            return list(super(C, self).__hash__ is not None for _i in range(2))
+
+    values = [1, 2]
+
+    print("getattr", set(getattr(x, "real") for x in values))
+    print("getattr default", list(getattr(x, "nope", x) for x in values))
+    print("hasattr", sum(hasattr(x, "real") for x in values))
+    print("setattr", all(setattr(C, "attr%d" % x, x) is None for x in values), C.attr2)
+    print("eval", max(eval("x*2", {"x" : x}) for x in values))
+    print("eval locals", min(eval("x+y", {}, {"x" : x, "y" : 1}) for x in values))
+    print("compile", any(compile("x", "<string>", "eval") is None for x in values))
+    print("__import__", tuple(__import__("os").__name__ for x in values))
+    print("type", list(type("T%d" % x, (object,), {"x" : x}).x for x in values))
+    print("super", C().method())
+
+builtinCallsInConsumedGeneratorExpressions()
+
+# A "StopIteration" raised inside the generator expression ends it, also when
+# it is in-lined into the built-in consuming it. Done at module level, where
+# the iterator is not a closure variable, so in-lining happens.
+it = iter([1, 2])
+print("list", list(next(it) for _i in range(5)))
+
+it = iter([1, 2])
+print("sum", sum(next(it) for _i in range(5)))
+
+it = iter([1, 2])
+print("max", max(next(it) for _i in range(5)))
+
+it = iter([])
+try:
+    print("max empty", max(next(it) for _i in range(5)))
+except ValueError as e:
+    print("max empty gives", repr(e))
+
+it = iter([0, 0])
+print("any", any(next(it) for _i in range(5)))
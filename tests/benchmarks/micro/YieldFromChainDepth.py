@@ -0,0 +1,54 @@
+#     Copyright 2015, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+
+# Measures resuming chains of "yield from" delegation of increasing depth, as
+# is typical for code using "asyncio" coroutines. This is Python3.3 or higher.
+
+from __future__ import print_function
+
+import time
+
+
+def leaf(count):
+    for i in range(count):
+        yield i
+
+    return count
+
+def chain(depth, count):
+    if depth == 0:
+        result = yield from leaf(count)
+    else:
+        result = yield from chain(depth - 1, count)
+
+    return result
+
+def measure(depth, count):
+    start = time.time()
+
+    for _value in chain(depth, count):
+        pass
+
+    return time.time() - start
+
+if __name__ == "__main__":
+    for depth in (1, 4, 16, 64):
+        print("Depth %3d: %.3fs" % (depth, measure(depth, 100000)))
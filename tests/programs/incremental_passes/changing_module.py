@@ -0,0 +1,40 @@
+#     Copyright 2015, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+import used_module
+
+def compute(x):
+    # Only known to not be taken after propagating the value, and then the
+    # function defined in it is unused, with its assignment to "len".
+    a = None
+    b = a
+
+    if b is not None:
+        def shadowLen():
+            global len
+            len = None
+
+        shadowLen()
+
+    # Only known to not be taken in a later pass, when "len" is known to be
+    # the built-in. This removes the last use of a helper function of another
+    # module, which is not changed itself.
+    if len("ab") != 2:
+        return used_module.getValue(*())
+
+    return x * 2
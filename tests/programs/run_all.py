@@ -34,7 +34,8 @@ from test_common import (
     setup,
     createSearchMode,
     compareWithCPython,
-    withPythonPathChange
+    withPythonPathChange,
+    check_output
 )
 
 python_version = setup(needs_io_encoding = True)
@@ -43,6 +44,33 @@ search_mode = createSearchMode()
 
 extra_options = os.environ.get("NUITKA_EXTRA_OPTIONS","")
 
+def compareOptimizationPasses(dirname, filename):
+    """ Incremental optimization passes must give the same tree as full ones.
+
+    """
+    results = []
+
+    for flags in ([], ["--no-incremental-optimization"]):
+        results.append(
+            check_output(
+                [
+                    os.environ["PYTHON"],
+                    os.path.abspath(os.path.join("..", "..", "bin", "nuitka")),
+                    "--dump-xml",
+                    "--recurse-all"
+                ] + flags + [
+                    filename
+                ],
+                cwd = dirname
+            )
+        )
+
+    if results[0] != results[1]:
+        sys.exit(
+            "Error, incremental optimization passes differ for %s." % dirname
+        )
+
+
 for filename in sorted(os.listdir('.')):
     if not os.path.isdir(filename) or \
        filename.endswith(".build") or \
@@ -149,6 +177,9 @@ Error, no file ends with 'Main.py' or 'Main' in %s, incomplete test case.""" % (
                 search_mode = search_mode,
                 needs_2to3  = False
             )
+
+        if filename == "incremental_passes":
+            compareOptimizationPasses(filename, filename_main)
     else:
         my_print("Skipping", filename)
 